@@ -4,3 +4,15 @@
 from .catalog import *
 
 __version__ = "0.3.1"
+
+#: names exported lazily from the semistructured catalog module
+_semistructured_exports = ('csv_reader', 'json_reader', 'shred')
+
+
+def __getattr__(name):
+    # the semistructured readers are only imported on first access
+    if name in _semistructured_exports:
+        from .catalog import semistructured
+        globals().update({attr: getattr(semistructured, attr) for attr in _semistructured_exports})
+        return globals()[name]
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
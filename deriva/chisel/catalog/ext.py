@@ -1,17 +1,125 @@
 """Extended catalog model classes.
 """
+from collections import ChainMap
+from functools import lru_cache, partial
 import itertools
 import logging
 from pprint import pformat, pprint
 from deriva.core import ermrest_model as _erm
 from . import model
-from .stubs import CatalogStub
-from ..optimizer import symbols, planner, logical_planner, physical_planner, consolidate
+from .stubs import CatalogStub, _unknown_referenced_columns
+from ..optimizer import symbols, logical_planner, physical_planner, consolidate, PlanMemo
 from ..operators import Assign
 from .. import util
 
 logger = logging.getLogger(__name__)
 
+#: attribute mutation symbols allowed in projections
+_mutation_symbols = (symbols.AttributeDrop, symbols.AttributeAdd)
+
+#: symbols allowed as-is in column lists
+_column_symbols = (symbols.AttributeAlias,) + _mutation_symbols
+
+#: column list item kinds: columns (replaced by name), names or symbols (as-is), and mutations (as-is)
+_COLUMN, _SYMBOL, _MUTATION = range(3)
+
+#: column list item kinds by exact type, see `_column_list`; `Column` is registered after its definition
+_column_kinds = {
+    str: _SYMBOL,
+    symbols.AttributeAlias: _SYMBOL,
+    symbols.AttributeDrop: _MUTATION,
+    symbols.AttributeAdd: _MUTATION
+}
+
+#: symbols whose physical operators validate the descriptions of their inputs, see `ComputedRelation`
+_validated_symbols = (symbols.Union,)
+
+#: symbols allowed as where-clause expressions
+_formula_symbols = (symbols.Comparison, symbols.Conjunction, symbols.Disjunction)
+
+#: where-clause expressions that may be combined into a conjunction
+_conjunctive_symbols = (symbols.Comparison, symbols.Conjunction)
+
+
+#: comparison operand types that are not interned, as the cache key types only the container and not its elements
+_uninterned_operand_types = (tuple, frozenset, list, set, dict)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _comparison(name, operator, value):
+    """Returns the comparison symbol, interned so that repeated clauses share one (immutable) symbol."""
+    return symbols.Comparison(name, operator, value)
+
+
+@lru_cache(maxsize=1024)
+def _attribute_alias(name, alias):
+    """Returns the attribute alias symbol, interned (see `_comparison`)."""
+    return symbols.AttributeAlias(name, alias)
+
+
+@lru_cache(maxsize=1024)
+def _attribute_drop(name):
+    """Returns the attribute drop symbol, interned (see `_comparison`)."""
+    return symbols.AttributeDrop(name)
+
+
+def _table_doc(models, schema_name, table_name):
+    """Returns the doc of the named table from the first of the models that has it, or None if none of them do.
+    """
+    for model_ in models:
+        try:
+            return model_.schemas[schema_name].tables[table_name].prejson()
+        except (AttributeError, KeyError):
+            pass
+    return None
+
+
+def _plan_memo(model_):
+    """Returns the memo of logical plans of the relations computed from a model, making it on first use.
+
+    Relations bound to stubbed out models share the memo of the model they were computed from.
+    """
+    model_ = getattr(model_, '_source_model', model_)
+    try:
+        return model_._plan_memo
+    except AttributeError:
+        model_._plan_memo = memo = PlanMemo()
+        return memo
+
+
+def _source_schemas(model_):
+    """Returns the schemas of the model that a stubbed out model (see `ComputedRelation._bind`) stubs out, if any.
+    """
+    return getattr(getattr(model_, '_source_model', None), 'schemas', None)
+
+
+def _column_list(columns):
+    """Validates and cleans up a column list in a single pass.
+
+    :param columns: sequence of columns, column names, or column symbols
+    :return: (tuple of names or symbols, count of mutation symbols among them)
+    """
+    items = []
+    mutations = 0
+    for column in columns:
+        kind = _column_kinds.get(type(column))
+        if kind is None:  # subclasses of the registered types
+            if isinstance(column, Column):
+                kind = _COLUMN
+            elif isinstance(column, _mutation_symbols):
+                kind = _MUTATION
+            elif isinstance(column, (str,) + _column_symbols):
+                kind = _SYMBOL
+            else:
+                raise ValueError("Unsupported type '%s' in column list" % type(column).__name__)
+        if kind == _COLUMN:
+            items.append(column._wrapped_obj.name)  # read off the underlying column, bypassing the property
+        else:
+            items.append(column)
+            if kind == _MUTATION:
+                mutations += 1
+    return tuple(items), mutations
+
 
 class Model (model.Model):
     """Catalog model.
@@ -26,8 +134,15 @@ class Model (model.Model):
         :param catalog: ErmrestCatalog or catalog-like object
         """
         super(Model, self).__init__(catalog)
-        self._new_schema = lambda obj: Schema(self, obj)
-        self._new_fkey = lambda obj: ForeignKey(self.schemas[obj.table.schema.name].tables[obj.table.name], obj)
+        self._new_schema = partial(Schema, self)
+        self._new_fkey = lambda obj: ForeignKey(self._wrap_table(obj.table), obj)
+
+    @property
+    def schemas(self):
+        schemas = super(Model, self).schemas
+        source_schemas = _source_schemas(self)
+        # a model stubbed out for a computed relation falls back to the model it stubs out for the schemas it lacks
+        return schemas if source_schemas is None else ChainMap(schemas, source_schemas)
 
     def make_extant_symbol(self, schema_name, table_name):
         """Makes a symbol for representing an extant relation.
@@ -129,21 +244,22 @@ class Model (model.Model):
         :param computed_relations: sequence of computed relations to be committed to the model
         :param dry_run: run operations, but do not materialize to the remote catalog
         :param enable_work_sharing: enable the (experimental) work sharing algorithm
+        :return: list of the tables created in the remote catalog (empty if dry_run)
         """
 
         # decompose, optimize and rewrite the logical plans for each computed relation
         for computed_relation in computed_relations:
-            computed_relation._logical_plan = logical_planner(computed_relation._logical_plan)
+            computed_relation._logical_plan = computed_relation._optimized_logical_plan()
 
-        # look for work sharing (consolidation) of computed relations
-        if enable_work_sharing:
-            consolidate(computed_relations)
+        # look for work sharing (consolidation) within and across the computed relations
+        tempvars = consolidate(computed_relations) if enable_work_sharing else ()
 
-        # materialize the computed relations
-        for computed_relation in computed_relations:
+        # rewrite logical to physical plans, so that any planning errors are raised before materializing any relation
+        physical_plans = [physical_planner(computed_relation._logical_plan) for computed_relation in computed_relations]
 
-            # rewrite logical to physical plan
-            physical_plan = physical_planner(computed_relation._logical_plan)
+        # materialize the computed relations
+        created_tables = []
+        for computed_relation, physical_plan in zip(computed_relations, physical_plans):
 
             if dry_run:
                 # log details of the evaluated operation without committing to remote catalog
@@ -177,14 +293,15 @@ class Model (model.Model):
                 )
 
                 # create table in remote catalog
-                self.schemas[schema_name].create_table(table_doc)
+                table = self.schemas[schema_name].create_table(table_doc)
+                created_tables.append(table)
 
                 # populate new_table from physical plan for this relation
                 paths = self.catalog.getPathBuilder()
                 new_table = paths.schemas[schema_name].tables[table_name]
 
                 # ...determine the nondefaults for the insert
-                planned_column_names = set([col['name'] for col in desc['column_definitions']])
+                planned_column_names = {col['name'] for col in desc['column_definitions']}
                 nondefaults = {'RID', 'RCB', 'RCT'} & planned_column_names  # write syscol values if defined in plan
 
                 # ...stream tuples from the physical operator to the remote catalog
@@ -195,7 +312,6 @@ class Model (model.Model):
 
                 # update default vizfkeys of referred pk tables (*experimental*)
                 if self.update_default_vizfkeys_on_commit:
-                    table = self.schemas[schema_name].tables[table_name]
                     for fkey in table.foreign_keys:
                         vizfkeys = fkey.pk_table.annotations.get(_erm.tag.visible_foreign_keys, {}).get('*')
                         if isinstance(vizfkeys, list):
@@ -206,6 +322,14 @@ class Model (model.Model):
             else:
                 raise ValueError('Computed relation evaluated to "%s" object cannot be materialized' % type(physical_plan).__name__)
 
+        # forget the plans of this model's relations, which keep alive their inputs, and the rows of the temporary
+        # variables, which are computed once per commit
+        _plan_memo(self).clear()
+        for tempvar in tempvars:
+            tempvar._materialized = None
+
+        return created_tables
+
 
 class Schema (model.Schema):
     """Schema within a catalog model.
@@ -217,7 +341,16 @@ class Schema (model.Schema):
         :param schema: underlying ermrest_model.Schema instance.
         """
         super(Schema, self).__init__(parent, schema)
-        self._new_table = lambda obj: Table(self, obj)
+        self._new_table = partial(Table, self)
+
+    @property
+    def tables(self):
+        tables = super(Schema, self).tables
+        source_schemas = _source_schemas(self.model)
+        # a schema stubbed out for a computed relation falls back to the schema it stubs out for the tables it lacks
+        if source_schemas is None or self.name not in source_schemas:
+            return tables
+        return ChainMap(tables, source_schemas[self.name].tables)
 
     def create_table_as(self, table_name, expression, dry_run=False):
         """Create table as defined by an expression.
@@ -237,11 +370,11 @@ class Schema (model.Schema):
         if not isinstance(expression, ComputedRelation):
             raise ValueError('"expression" must be instance of ComputedRelation')
 
-        self.model._commit([
+        created_tables = self.model._commit([
             ComputedRelation(self, symbols.Assign(expression._logical_plan, self.name, table_name))
         ], dry_run=dry_run)
 
-        return None if dry_run else self.tables[table_name]
+        return None if dry_run else created_tables[0]
 
 
 class Table (model.Table):
@@ -255,30 +388,35 @@ class Table (model.Table):
         :param logical_plan: logical plan to use instead of an 'extant' representation
         """
         super(Table, self).__init__(parent, table)
-        self._new_column = lambda obj: Column(self, obj)
-        self._new_key = lambda obj: Key(self, obj)
-        self._new_fkey = lambda obj: ForeignKey(self, obj)
-        self._logical_plan = logical_plan or self.schema.model.make_extant_symbol(self.schema.name, self.name)
+        self._new_column = partial(Column, self)
+        self._new_key = partial(Key, self)
+        self._new_fkey = partial(ForeignKey, self)
+        self._logical_plan_cache = logical_plan or None  # extant symbol is made on first use, see `_logical_plan`
+
+    @property
+    def _logical_plan(self):
+        if self._logical_plan_cache is None:
+            self._logical_plan_cache = self.schema.model.make_extant_symbol(self.schema.name, self.name)
+        return self._logical_plan_cache
+
+    @_logical_plan.setter
+    def _logical_plan(self, value):
+        self._logical_plan_cache = value
+
+    @property
+    def _parent(self):
+        # parent schema of relations computed from this table, see `ComputedRelation._parent`
+        return self.schema
 
     def _columns_to_symbols(self, *columns):
         """Validates and returns cleaned up column list.
         """
-        def _column_to_symbol(column):
-            if isinstance(column, Column):
-                return column.name
-            elif isinstance(column, str):
-                return column
-            elif any(isinstance(column, t) for t in (symbols.AttributeAlias, symbols.AttributeDrop, symbols.AttributeAdd)):
-                return column
-            else:
-                raise ValueError("Unsupported type '%s' in column list" % type(column).__name__)
-
-        return tuple([_column_to_symbol(c) for c in columns])
+        return _column_list(columns)[0]
 
     def alter(self, **kwargs):
-        # Wraps the underlying object's `alter` method, updates logical plan (just in case) and copies its documentation
+        # Wraps the underlying object's `alter` method, invalidates logical plan (just in case) and copies its documentation
         self._wrapped_obj.alter(**kwargs)
-        self._logical_plan = self.schema.model.make_extant_symbol(self.schema.name, self.name)
+        self._logical_plan_cache = None
         return self
 
     alter.__doc__ = _erm.Table.alter.__doc__
@@ -297,20 +435,19 @@ class Table (model.Table):
         :return: computed relation
         """
         if columns:
-            projection = self._columns_to_symbols(*columns)
+            projection, mutations = _column_list(columns)
 
-            # validation: if any mutation (add/drop), all must be mutations (can't mix with other projections)
-            for mutation in (symbols.AttributeAdd, symbols.AttributeDrop):
-                mutations = [isinstance(o, mutation) for o in projection]
-                if any(mutations):
-                    if not all(mutations):
-                        raise ValueError("Attribute add/drop cannot be mixed with other attribute projections")
-                    projection = (symbols.AllAttributes()) + projection
+            # validation: if any mutation (add/drop), all must be mutations of one kind (can't mix with other projections)
+            if mutations:
+                if mutations != len(projection) or len({type(item) for item in projection}) > 1:
+                    raise ValueError("Attribute add/drop cannot be mixed with other attribute projections")
+                projection = (symbols.AllAttributes(),) + projection
 
         else:
-            projection = tuple([c.name for c in self.columns])
+            # read names off the underlying columns, rather than wrapping every column only to get its name
+            projection = tuple([c.name for c in self._wrapped_obj.columns])
 
-        return ComputedRelation(self.schema, symbols.Project(self._logical_plan, projection))
+        return ComputedRelation(self._parent, symbols.Project(self._logical_plan, projection))
 
     def join(self, right):
         """Joins with right-hand relation.
@@ -321,7 +458,7 @@ class Table (model.Table):
         if not isinstance(right, Table):
             raise ValueError('Right-hand object must be an instance of "Table"')
 
-        return ComputedRelation(self.schema, symbols.Join(self._logical_plan, right._logical_plan))
+        return ComputedRelation(self._parent, symbols.Join(self._logical_plan, right._logical_plan))
 
     def where(self, expression):
         """Filters the rows of this table according to the where-clause expression.
@@ -329,11 +466,16 @@ class Table (model.Table):
         :param expression: where-clause expression (instance of Comparison, Conjunction, or Disjunction)
         :return: table instance
         """
-        if not (isinstance(expression, symbols.Comparison) or isinstance(expression, symbols.Conjunction) or
-                isinstance(expression, symbols.Disjunction)):
+        if not isinstance(expression, _formula_symbols):
             raise ValueError('expression of type "%s" not supported' % type(expression).__name__)
 
-        return ComputedRelation(self.schema, symbols.Select(self._logical_plan, expression))
+        plan = self._logical_plan
+        if isinstance(plan, symbols.Select) and \
+                isinstance(plan.formula, _conjunctive_symbols) and isinstance(expression, _conjunctive_symbols):
+            # fuse with the filter of this relation, rather than nesting another filter
+            return ComputedRelation(self._parent, symbols.Select(plan.child, plan.formula & expression))
+
+        return ComputedRelation(self._parent, symbols.Select(plan, expression))
 
     def union(self, other):
         """Produce a union with another relation.
@@ -344,7 +486,7 @@ class Table (model.Table):
         if not isinstance(other, Table):
             raise ValueError('Parameter "other" must be a Table instance')
 
-        return ComputedRelation(self.schema, symbols.Union(self._logical_plan, other._logical_plan))
+        return ComputedRelation(self._parent, symbols.Union(self._logical_plan, other._logical_plan))
 
     __add__ = union
 
@@ -354,7 +496,7 @@ class Table (model.Table):
         :param columns: positional arguments of columns or column names
         :return: computed relation
         """
-        return ComputedRelation(self.schema, symbols.ReifySub(self._logical_plan, self._columns_to_symbols(*columns)))
+        return ComputedRelation(self._parent, symbols.ReifySub(self._logical_plan, self._columns_to_symbols(*columns)))
 
     def associate(self, *fk_columns):
         """Forms a new 'child' relation from a subset of foreign key columns within this relation.
@@ -362,7 +504,7 @@ class Table (model.Table):
         :param fk_columns: positional arguments of columns or column names belonging to a foreign key
         :return: computed relation
         """
-        return ComputedRelation(self.schema, symbols.Associate(self._logical_plan, self._columns_to_symbols(*fk_columns)))
+        return ComputedRelation(self._parent, symbols.Associate(self._logical_plan, self._columns_to_symbols(*fk_columns)))
 
     def reify(self, unique_columns, *columns):
         """Forms a new relation from the specified columns.
@@ -376,10 +518,10 @@ class Table (model.Table):
         """
         unique_columns = self._columns_to_symbols(*unique_columns)
         nonkey_columns = self._columns_to_symbols(*columns)
-        if set(unique_columns) & set(nonkey_columns):
+        if not set(unique_columns).isdisjoint(nonkey_columns):
             raise ValueError('"key_columns" and "nonkey_columns" must be disjoint sets')
 
-        return ComputedRelation(self.schema, symbols.Reify(self._logical_plan, unique_columns, nonkey_columns))
+        return ComputedRelation(self._parent, symbols.Reify(self._logical_plan, unique_columns, nonkey_columns))
 
 
 class ComputedRelation (Table):
@@ -389,19 +531,73 @@ class ComputedRelation (Table):
     def __init__(self, parent, logical_plan):
         """Initializes the computed relation.
 
+        The relation is not planned until it is first used as a table (e.g., its columns or description are accessed),
+        so that intermediate and to-be-committed expressions do not pay for planning up front. Unions are the exception,
+        as their inputs must have matching column definitions, which is checked when they are planned.
+
         :param parent: the parent of this model object.
         :param logical_plan: chisel logical plan expression used to define this table
         """
+        # note: the super class (i.e., Table object) is initialized by `_bind`, on first access of its attributes
+        self._unbound_parent = parent
+        self._logical_plan_cache = logical_plan
+        self._planned = (None, None)
+        self._unfetched = (None, None)  # physical plan made by `_bind`, which is reused by the next `fetch`
+        self._materialized = None  # rows of this relation computed as a temporary variable during a commit, see `TempVarRef`
+
+        # operators that validate the descriptions of their inputs are planned now, so that errors are raised here
+        if isinstance(logical_plan, _validated_symbols):
+            self._bind()
+
+    def __getattr__(self, name):
+        # only reached for attributes not found by normal lookup, which for an unbound relation includes the wrapped
+        # table and everything derived from it
+        if self.__dict__.get('_unbound_parent') is None:
+            return super(ComputedRelation, self).__getattr__(name)
+        try:
+            self._bind()
+        except AttributeError as error:
+            # do not let a failure to bind pass for a missing attribute
+            raise ValueError('Computed relation could not be planned: %s' % error) from error
+        return getattr(self, name)
+
+    def _bind(self):
+        """Plans the relation and binds it to a table in a stubbed out model that includes its description.
+
+        The stubbed out model holds only the relation and the tables its foreign keys reference, as stubbed copies
+        whose own foreign keys are limited to tables in the stub; lookups of any other schema or table fall back to
+        the source model.
+        """
+        logical_plan = self._logical_plan_cache
 
-        # invoke the expression planner to generate a physical operator plan
-        plan = planner(logical_plan)
+        parent = self._unbound_parent
 
-        # get the whole model doc and graft this computed relation into it
-        computed_model_doc = parent.model.prejson()
-        computed_model_doc['schemas'][parent.name]['tables'][plan.description['table_name']] = plan.description
+        # invoke the expression planner to generate a physical operator plan
+        optimized_plan = self._optimized_logical_plan()
+        plan = physical_planner(optimized_plan)
+
+        # graft this computed relation into a model doc with only the tables referenced by its foreign keys, which is
+        # all that binding it requires; referenced tables are found in the parent model or else the model it stubs out
+        table_doc = plan.description
+        source_model = getattr(parent.model, '_source_model', parent.model)
+        models = (parent.model,) if source_model is parent.model else (parent.model, source_model)
+        schema_docs = {parent.name: {'schema_name': parent.name, 'tables': {table_doc['table_name']: table_doc}}}
+        for fkey_doc in table_doc.get('foreign_keys', ()):
+            ref_col = fkey_doc.get('referenced_columns', _unknown_referenced_columns)[0]
+            sname, tname = ref_col.get('schema_name'), ref_col.get('table_name')
+            tables = schema_docs.setdefault(sname, {'schema_name': sname, 'tables': {}})['tables']
+            if tname not in tables:
+                ref_table_doc = _table_doc(models, sname, tname)
+                if ref_table_doc is not None:
+                    tables[tname] = ref_table_doc
 
         # instantiate a stubbed out model object
-        computed_model = Model(CatalogStub(model_doc=computed_model_doc))
+        computed_model = Model(CatalogStub(model_doc={'schemas': schema_docs}))
+        computed_model._source_model = source_model
+
+        # the relation is bound only once it has been planned, so that a planning error leaves it unbound
+        self._unbound_parent = None
+        self._unfetched = (optimized_plan, plan)
 
         # instantiate this object's super class (i.e., Table object)
         super(ComputedRelation, self).__init__(
@@ -409,6 +605,13 @@ class ComputedRelation (Table):
             computed_model.schemas[parent.name].tables[plan.description['table_name']],
             logical_plan=logical_plan
         )
+        self._logical_plan_cache = logical_plan
+
+    @property
+    def _parent(self):
+        # an unbound relation lends its parent to the relations computed from it, so that composing them does not bind it
+        parent = self._unbound_parent
+        return self.schema if parent is None else parent
 
     @property
     def logical_plan(self):
@@ -418,58 +621,93 @@ class ComputedRelation (Table):
     def logical_plan(self, value):
         self._logical_plan = value
 
+    def _optimized_logical_plan(self):
+        """Returns the optimized logical plan, reusing the memoized plan unless the logical plan has been replaced.
+        """
+        source_plan, optimized_plan = self._planned
+        if source_plan is not self._logical_plan:
+            if self._logical_plan is not optimized_plan:  # replacing the plan by its optimized plan (e.g., on commit) keeps it
+                optimized_plan = logical_planner(self._logical_plan, _plan_memo(self._parent.model))
+            self._planned = (self._logical_plan, optimized_plan)
+        return optimized_plan
+
     def fetch(self):
         """Returns an iterator over the rows of this relation.
         """
-        return planner(self._logical_plan)
+        optimized_plan = self._optimized_logical_plan()
+        planned, plan = self._unfetched
+        if planned is optimized_plan:
+            # physical operators may buffer their inputs, so the plan made when binding is only used once
+            self._unfetched = (None, None)
+            return plan
+        return physical_planner(optimized_plan)
+
+    def fetch_arrow(self):
+        """Returns the rows of this relation as a columnar table, which requires the optional `pyarrow` package.
+
+        :return: a `pyarrow.Table` with the columns of this relation, in order
+        """
+        try:
+            import pyarrow as _pa  # deferred so that pyarrow is only imported when a columnar table is fetched
+        except ImportError:
+            raise ImportError('fetching a relation as a columnar table requires the "pyarrow" package') from None
+
+        plan = self.fetch()
+        names = [col['name'] for col in plan.description['column_definitions']]
+        columns = [[] for _ in names]
+        appends = [column.append for column in columns]
+        # stream the rows into the columns, rather than buffering the rows first
+        for row in plan:
+            for name, append in zip(names, appends):
+                append(row.get(name))
+        return _pa.table(dict(zip(names, columns)))
 
 
 class Column (model.Column):
     """Column within a table.
     """
-    def __init__(self, parent, column):
-        """Initializes the column.
-
-        :param parent: the parent of this model object.
-        :param column: the underlying ermrest_model.Column
-        """
-        super(Column, self).__init__(parent, column)
-
-    def eq(self, other):
-        return symbols.Comparison(operand1=self.name, operator='eq', operand2=other)
-
-    __eq__ = eq
-
-    def lt(self, other):
-        return symbols.Comparison(operand1=self.name, operator='lt', operand2=other)
-
-    __lt__ = lt
-
-    def le(self, other):
-        return symbols.Comparison(operand1=self.name, operator='le', operand2=other)
-
-    __le__ = le
-
-    def gt(self, other):
-        return symbols.Comparison(operand1=self.name, operator='gt', operand2=other)
-
-    __gt__ = gt
+    # note: columns are initialized by `model.Column.__init__`, as they are wrapped on every access of a column list
+
+    def _comparator(operator):
+        # builds a comparison method for the given operator; the symbol is constructed positionally, which avoids the
+        # keyword argument handling of the namedtuple constructor on this frequently used path
+        comparison = symbols.Comparison
+
+        def compare(self, other):
+            if isinstance(other, _uninterned_operand_types):
+                return comparison(self._wrapped_obj.name, operator, other)
+            try:
+                return _comparison(self._wrapped_obj.name, operator, other)
+            except TypeError:
+                return comparison(self._wrapped_obj.name, operator, other)  # unhashable values are not interned
+
+        compare.__name__ = operator
+        compare.__doc__ = \
+            """Creates and returns a comparison clause.
+
+            :param other: assumes a literal value; column references not allows
+            :return: a symbolic comparison clause to be used in other statements
+            """
+        return compare
 
-    def ge(self, other):
-        return symbols.Comparison(operand1=self.name, operator='ge', operand2=other)
+    eq = __eq__ = _comparator('eq')
+    lt = __lt__ = _comparator('lt')
+    le = __le__ = _comparator('le')
+    gt = __gt__ = _comparator('gt')
+    ge = __ge__ = _comparator('ge')
 
-    __ge__ = ge
+    del _comparator
 
-    eq.__doc__ = \
-    lt.__doc__ = \
-    le.__doc__ = \
-    gt.__doc__ = \
-    ge.__doc__ = \
-        """Creates and returns a comparison clause.
+    def isin(self, values):
+        """Creates and returns a clause that compares this column to any of the given values.
 
-        :param other: assumes a literal value; column references not allows
-        :return: a symbolic comparison clause to be used in other statements
+        :param values: an iterable of literal values; column references not allowed
+        :return: a symbolic disjunction of equality comparisons to be used in other statements
         """
+        comparisons = tuple(self.eq(value) for value in values)
+        if not comparisons:
+            raise ValueError('values must not be empty')
+        return comparisons[0] if len(comparisons) == 1 else symbols.Disjunction(comparisons)
 
     def alias(self, name):
         """Returns a 'column alias' clause that may be used in 'select' operations.
@@ -477,14 +715,14 @@ class Column (model.Column):
         :param name: name to use as an alias for this column
         :return: column alias symbol for use in expressions
         """
-        return symbols.AttributeAlias(self.name, name)
+        return _attribute_alias(self.name, name)
 
     def inv(self):
         """Returns a 'remove column' clause that may be used in 'select' operations to remove this column.
 
         :return: remove column clause
         """
-        return symbols.AttributeDrop(self.name)
+        return _attribute_drop(self.name)
 
     __invert__ = inv
     
@@ -496,7 +734,7 @@ class Column (model.Column):
         from the given `delim` delimiter character.
 
         :param delim: delimited character.
-        :param unnest_fn: custom unnesting function must be callable on each value of this column in the relation.
+        :param unnest_fn: custom unnesting function, callable on each value of this column, that returns an iterable of values.
         :return: a computed relation that can be assigned to a newly named table in the catalog.
         """
         if not unnest_fn:
@@ -541,7 +779,7 @@ class Column (model.Column):
 
         :param domain: a simple domain or a fully structured vocabulary
         :param delim: delimited character.
-        :param unnest_fn: custom unnesting function must be callable on each value of this column in the relation.
+        :param unnest_fn: custom unnesting function, callable on each value of this column, that returns an iterable of values.
         :param similarity_fn: a function for computing a similarity comparison between values in this column.
         :return: a computed relation that can be assigned to a newly named table in the catalog.
         """
@@ -556,6 +794,9 @@ class Column (model.Column):
         return ComputedRelation(self.table.schema, symbols.Tagify(domain._logical_plan, self.table._logical_plan, self.name, unnest_fn, similarity_fn, None))
 
 
+_column_kinds[Column] = _COLUMN
+
+
 class Key (model.Key):
     """Key within a table.
     """
@@ -568,7 +809,7 @@ class Key (model.Key):
         super(Key, self).__init__(parent, constraint)
         self._new_schema = lambda obj: Schema(parent.schema.model, obj)
         self._new_table = lambda obj: Table(parent.schema, obj)
-        self._new_column = lambda obj: Column(parent.schema.model.schemas[obj.table.schema.name].tables[obj.table.name], obj)
+        self._new_column = lambda obj: Column(parent.schema.model._wrap_table(obj.table), obj)
 
 
 class ForeignKey (model.ForeignKey):
@@ -582,5 +823,5 @@ class ForeignKey (model.ForeignKey):
         """
         super(ForeignKey, self).__init__(parent, constraint)
         self._new_schema = lambda obj: Schema(obj.model, obj)
-        self._new_table = lambda obj: Table(parent.schema, obj)
-        self._new_column = lambda obj: Column(parent.schema.model.schemas[obj.table.schema.name].tables[obj.table.name], obj)
+        self._new_table = lambda obj: parent.schema.model._wrap_table(obj)
+        self._new_column = lambda obj: Column(parent.schema.model._wrap_table(obj.table), obj)
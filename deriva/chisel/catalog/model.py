@@ -1,5 +1,6 @@
 """Catalog model classes.
 """
+from functools import partial
 import logging
 from deriva.core import ermrest_model as _erm
 from .wrapper import MappingWrapper, SequenceWrapper, ModelObjectWrapper
@@ -19,8 +20,9 @@ class Model (object):
         super(Model, self).__init__()
         self._catalog = catalog
         self._wrapped_model = catalog.getCatalogModel()
-        self._new_schema = lambda obj: Schema(self, obj)
-        self._new_fkey = lambda obj: ForeignKey(self.schemas[obj.table.schema.name].tables[obj.table.name], obj)
+        self._new_schema = partial(Schema, self)
+        self._new_fkey = lambda obj: ForeignKey(self._wrap_table(obj.table), obj)
+        self._tables = {}  # cache of table wrappers keyed on (schema_name, table_name), see `_wrap_table`
         self.acls = self._wrapped_model.acls
         self.annotations = self._wrapped_model.annotations
         self.apply = self._wrapped_model.apply
@@ -53,6 +55,21 @@ class Model (object):
         """
         return self._new_fkey(self._wrapped_model.fkey(constraint_name_pair))
 
+    def _wrap_table(self, table):
+        """Returns the wrapper of an ermrest_model.Table of this model, without looking it up by name, reusing its wrapper
+        for as long as the underlying table is unchanged.
+        """
+        key = (table.schema.name, table.name)
+        wrapper = self._tables.get(key)
+        if wrapper is None or wrapper._wrapped_obj is not table:
+            wrapper = self._tables[key] = self._new_schema(table.schema)._new_table(table)
+        return wrapper
+
+    def _table(self, schema_name, table_name):
+        """Returns the table with the given names, reusing its wrapper (see `_wrap_table`).
+        """
+        return self._wrap_table(self._wrapped_model.schemas[schema_name].tables[table_name])
+
     def create_schema(self, schema_def):
         """Add a new schema to this model in the remote database based on schema_def.
 
@@ -79,7 +96,7 @@ class Schema (ModelObjectWrapper):
         """
         super(Schema, self).__init__(schema)
         self.model = parent
-        self._new_table = lambda obj: Table(self, obj)
+        self._new_table = partial(Table, self)
 
     @property
     def tables(self):
@@ -193,9 +210,9 @@ class Table (ModelObjectWrapper):
         """
         super(Table, self).__init__(table)
         self.schema = parent
-        self._new_column = lambda obj: Column(self, obj)
-        self._new_key = lambda obj: Key(self, obj)
-        self._new_fkey = lambda obj: ForeignKey(parent.model.schemas[obj.table.schema.name].tables[obj.table.name], obj)
+        self._new_column = partial(Column, self)
+        self._new_key = partial(Key, self)
+        self._new_fkey = lambda obj: ForeignKey(parent.model._wrap_table(obj.table), obj)
 
     @property
     def kind(self):
@@ -368,8 +385,8 @@ class Constraint (ModelObjectWrapper):
         """
         super(Constraint, self).__init__(constraint)
         self._new_schema = lambda obj: Schema(parent.schema.model, obj)
-        self._new_table = lambda obj: Table(parent.schema.model.schemas[obj.table.schema.name], obj)
-        self._new_column = lambda obj: Column(parent.schema.model.schemas[obj.table.schema.name].tables[obj.table.name], obj)
+        self._new_table = lambda obj: parent.schema.model._wrap_table(obj)
+        self._new_column = lambda obj: Column(parent.schema.model._wrap_table(obj.table), obj)
 
     @property
     def table(self):
@@ -414,7 +431,7 @@ class Key (Constraint):
         return self.unique_columns
 
     def __str__(self):
-        return '"%s" UNIQUE CONSTRAINT (%s)' % (self.constraint_name, ', '.join(['"%s"' % c.name for c in self.unique_columns]))
+        return '"%s" UNIQUE CONSTRAINT (%s)' % (self.constraint_name, ', '.join(['"%s"' % c.name for c in self._wrapped_obj.unique_columns]))
 
     def alter(self, **kwargs):
         super().alter(**kwargs)
@@ -429,9 +446,11 @@ class Key (Constraint):
         logging.debug('Dropping %s cascade %s' % (self.name, str(cascade)))
         if cascade:
             # drop dependent objects
-            for fkey in list(self.table.referenced_by):
-                assert self.table == fkey.pk_table, "Expected key.table and foreign_key.pk_table to match"
-                if self.unique_columns == fkey.referenced_columns:
+            table = self.table
+            unique_columns = self.unique_columns
+            for fkey in list(table.referenced_by):
+                assert table == fkey.pk_table, "Expected key.table and foreign_key.pk_table to match"
+                if unique_columns == fkey.referenced_columns:
                     logging.debug('Found dependent object %s' % fkey)
                     fkey.drop()
 
@@ -468,10 +487,10 @@ class ForeignKey (Constraint):
     def __str__(self):
         return '"%s" FOREIGN KEY (%s) --> "%s:%s" (%s)' % (
             self.constraint_name,
-            ', '.join(['"%s"' % c.name for c in self.foreign_key_columns]),
+            ', '.join(['"%s"' % c.name for c in self._wrapped_obj.foreign_key_columns]),
             self._wrapped_obj.pk_table.schema.name,
             self._wrapped_obj.pk_table.name,
-            ', '.join(['"%s"' % c.name for c in self.referenced_columns])
+            ', '.join(['"%s"' % c.name for c in self._wrapped_obj.referenced_columns])
         )
 
     def alter(self, **kwargs):
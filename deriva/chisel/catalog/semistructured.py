@@ -8,16 +8,91 @@ import os
 import csv
 import json
 import logging
+import math
 import re
 from typing import Optional, Any
 from urllib.parse import unquote as urlunquote
 from deriva.core import ermrest_model as _erm
 from deriva.core import datapath, DEFAULT_HEADERS
 from ..optimizer import symbols
+from ..operators.semistructured import _csv_dialect
 from . import ext, stubs
 
 logger = logging.getLogger(__name__)
 
+#: Supported file formats keyed on filename extension.
+_file_formats = {
+    'csv': 'csv',
+    'tsv': 'csv',
+    'txt': 'csv',
+    'json': 'json'
+}
+
+
+def _file_format(filename):
+    """Returns the file format (i.e., 'csv' or 'json') of a file based on its extension.
+
+    :param filename: a filename
+    :return: the file format or None if the extension is not supported
+    """
+    _, dot, ext = filename.rpartition('.')
+    return _file_formats.get(ext) if dot else None
+
+
+#: Shared encoder for writing JSON data files.
+_json_encoder = json.JSONEncoder(indent=2)
+
+try:
+    # optional, faster encoder for writing JSON data files
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _special_floats(obj):
+    """Tests whether an object has floats that the standard encoder writes differently than `orjson`.
+
+    These are the non-finite floats (i.e., NaN or infinity), which `orjson` encodes as null, and the floats written in
+    exponent form (e.g., `1e-07` or `1e+16`), which `orjson` formats differently (e.g., `1e-7` or `1e16`).
+
+    :param obj: a JSON serializable object
+    :return: True if any float in the object is special
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj) or 'e' in repr(obj)
+    elif isinstance(obj, dict):
+        return any(map(_special_floats, obj.values()))
+    elif isinstance(obj, (list, tuple)):
+        return any(map(_special_floats, obj))
+    return False
+
+
+def _encode_json(obj):
+    """Encodes an object as indented JSON text, using `orjson` when available.
+
+    The text is meant to be the same as the standard encoder's: `orjson` is not used for objects with special floats
+    (see `_special_floats`), and its text is not used if it has non-ASCII characters or DEL, which the standard encoder
+    escapes. Other formatting differences between the encoders, if any, are not guarded against.
+
+    :param obj: a JSON serializable object
+    :return: JSON text
+    """
+    if _orjson is not None and not _special_floats(obj):
+        try:
+            text = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # not supported by orjson (e.g., non-string keys), fall back to the standard encoder
+        else:
+            if text.isascii() and '\x7f' not in text:
+                return text
+    return _json_encoder.encode(obj)
+
+#: Resource path pattern for table creation requests.
+_table_path_re = re.compile(r'/schema/(?P<schema_name>[^/]+)/table')
+
+#: Resource path pattern for row insertion requests.
+_entity_path_re = re.compile(r'/entity/(?P<schema_name>[^/]+):(?P<table_name>[^/?]+)([?]defaults=(?P<defaults>.+))?')
+
 
 def _introspect(path):
     """Introspects the model of semistructured files in a shallow directory hierarchy.
@@ -29,9 +104,10 @@ def _introspect(path):
         abs_filename = os.path.join(base_dir, schema_name, filename)
         if os.path.isdir(abs_filename):
             return None
-        elif filename.endswith('.csv') or filename.endswith('.tsv') or filename.endswith('.txt'):
+        file_format = _file_format(filename)
+        if file_format == 'csv':
             return csv_reader(abs_filename).prejson()
-        elif filename.endswith('.json'):
+        elif file_format == 'json':
             return json_reader(abs_filename).prejson()
         else:
             logger.warning('Unsupported file extension encountered for file: {file}'.format(file=abs_filename))
@@ -117,7 +193,7 @@ class SemiStructuredCatalog (stubs.CatalogStub):
         logger.debug('json: %s' % str(json))
 
         # handle table creation
-        m = re.match(r'/schema/(?P<schema_name>[^/]+)/table', path)
+        m = _table_path_re.match(path)
         if m:
             try:
                 schema_name = urlunquote(m.group('schema_name'))
@@ -126,7 +202,7 @@ class SemiStructuredCatalog (stubs.CatalogStub):
                 return SemiStructuredCatalog.Response(error=e)
 
         # handle row insertion
-        m = re.match(r'/entity/(?P<schema_name>[^/]+):(?P<table_name>[^/?]+)([?]defaults=(?P<defaults>.+))?', path)
+        m = _entity_path_re.match(path)
         if m:
             try:
                 schema_name = urlunquote(m.group('schema_name'))
@@ -159,11 +235,12 @@ class SemiStructuredCatalog (stubs.CatalogStub):
         if os.path.exists(filename):
             raise ValueError('%s:%s exists')
 
-        if filename.endswith('.json'):
+        file_format = _file_format(filename)
+        if file_format == 'json':
             with open(filename, 'w') as jsonfile:
-                json.dump([], jsonfile, indent=2)
-        elif filename.endswith('.csv') or filename.endswith('.tsv') or filename.endswith('.txt'):
-            dialect = 'excel' if filename.endswith('.csv') else 'excel-tab'
+                jsonfile.write(_encode_json([]))
+        elif file_format == 'csv':
+            dialect = _csv_dialect(filename)
             field_names = [col['name'] for col in table_def['column_definitions']]
             with open(filename, 'w') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=field_names, dialect=dialect)
@@ -195,13 +272,14 @@ class SemiStructuredCatalog (stubs.CatalogStub):
         if not os.path.exists(filename):
             raise KeyError('%s:%s does not exist')
 
-        if filename.endswith('.json'):
+        file_format = _file_format(filename)
+        if file_format == 'json':
             with open(filename, 'a') as jsonfile:
-                json.dump(rows, jsonfile, indent=2)
-        elif filename.endswith('.csv') or filename.endswith('.tsv') or filename.endswith('.txt'):
-            dialect = 'excel' if filename.endswith('.csv') else 'excel-tab'
+                jsonfile.write(_encode_json(rows))
+        elif file_format == 'csv':
+            dialect = _csv_dialect(filename)
             with open(filename, 'r') as csvfile:
-                reader = csv.DictReader(csvfile)
+                reader = csv.DictReader(csvfile, dialect=dialect)
                 field_names = reader.fieldnames
             with open(filename, 'a') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=field_names, dialect=dialect)
@@ -222,6 +300,7 @@ class SemiStructuredModel (ext.Model):
         """
         assert isinstance(catalog, SemiStructuredCatalog)
         super(SemiStructuredModel, self).__init__(catalog)
+        self._extant_symbols = {}  # cache of extant symbols keyed on (schema_name, table_name)
 
     def make_extant_symbol(self, schema_name, table_name):
         """Makes a symbol for representing an extant relation.
@@ -229,14 +308,21 @@ class SemiStructuredModel (ext.Model):
         :param schema_name: schema name
         :param table_name: table name
         """
+        key = (schema_name, table_name)
+        if key in self._extant_symbols:
+            return self._extant_symbols[key]
+
         filename = os.path.join(os.path.expanduser(self.catalog.rootdir), schema_name, table_name)
-        if filename.endswith('.csv') or filename.endswith('.tsv') or filename.endswith('.txt'):
-            return symbols.TabularDataExtant(filename=filename)
-        elif filename.endswith('.json'):
-            return symbols.JSONDataExtant(
+        file_format = _file_format(filename)
+        if file_format == 'csv':
+            symbol = symbols.TabularDataExtant(filename=filename)
+        elif file_format == 'json':
+            symbol = symbols.JSONDataExtant(
                 input_filename=filename, json_content=None, object_payload=None, key_regex=None)
         else:
             raise ValueError('Filename extension must be "csv" or "json" (filename: %s)' % filename)
+        self._extant_symbols[key] = symbol
+        return symbol
 
 
 def csv_reader(filename):
@@ -274,13 +360,15 @@ def json_reader(input_filename=None, json_content=None, object_payload=None, key
 def shred(filename_or_graph, sparql_query):
     """Shreds graph data (e.g., RDF, JSON-LD, etc.) into relational (tabular) data structure as a computed relation.
 
-    :param filename_or_graph: a filename of an RDF jsonld graph or a parsed rdflib.Graph instance
-    :param sparql_query: SPARQL query expression
+    The graph is validated without testing its truthiness, which for an `rdflib.Graph` would count its triples.
+
+    :param filename_or_graph: a non-empty filename of an RDF jsonld graph or a parsed rdflib.Graph instance
+    :param sparql_query: a non-empty SPARQL query expression string
     :return: a computed relation object
     """
-    if not filename_or_graph:
+    if filename_or_graph is None or (isinstance(filename_or_graph, str) and not filename_or_graph):
         raise ValueError('Parameter "filename_or_graph" must be a filename or a graph object')
-    if not sparql_query:
+    if not isinstance(sparql_query, str) or not sparql_query:
         raise ValueError('Parameter "sparql_query" must be a SPARQL query expression string')
 
     return ext.ComputedRelation(stubs.SchemaStub('.'), symbols.Shred(filename_or_graph, sparql_query))
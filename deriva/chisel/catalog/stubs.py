@@ -1,7 +1,12 @@
 """Catalog model stubs.
 """
+from types import MappingProxyType
 from deriva.core import ermrest_model as _erm, DEFAULT_HEADERS
 
+#: shared, immutable defaults for optional parts of model documents that are only read
+_empty_mapping = MappingProxyType({})
+_unknown_referenced_columns = (_empty_mapping,)
+
 
 class CatalogStub (object):
     """Stubbed out catalog to simulate ErmrestCatalog interfaces used by catalog model objects.
@@ -37,26 +42,40 @@ class ModelStub:
     """
 
     class _TableStub:
+        __slots__ = ('schema', 'name', 'annotations')
+
         def __init__(self, schema, table_name, table_doc):
             self.schema = schema
             self.name = table_name
             self.annotations = table_doc.get('annotations', {})
-            for fkey_doc in table_doc.get('foreign_keys', []):
+            for fkey_doc in table_doc.get('foreign_keys', ()):
                 schema._fkeys[fkey_doc['names'][0][1]] = ModelStub._ForeignKeyStub(self, fkey_doc)
 
     class _SchemaStub:
+        __slots__ = ('model', 'name', '_fkeys', 'tables')
+
         def __init__(self, model, schema_name, schema_doc):
             self.model = model
             self.name = schema_name
             self._fkeys = {}
-            self.tables = {k: ModelStub._TableStub(self, k, v) for k, v in schema_doc.get('tables', {}).items()}
+            self.tables = {k: ModelStub._TableStub(self, k, v) for k, v in schema_doc.get('tables', _empty_mapping).items()}
 
     class _ForeignKeyStub:
+        __slots__ = ('table', '_fkey_doc', 'names', '_pk_table')
+
         def __init__(self, table, fkey_doc):
             self.table = table
             self._fkey_doc = fkey_doc
             self.names = fkey_doc.get('names', [])
-            self.pk_table = None
+            self._pk_table = None
+
+        @property
+        def pk_table(self):
+            """The referenced table if known to the model, resolved on first access."""
+            if self._pk_table is None:
+                ref_col = self._fkey_doc.get('referenced_columns', _unknown_referenced_columns)[0]
+                self._pk_table = self.table.schema.model._table(ref_col.get('schema_name'), ref_col.get('table_name'))
+            return self._pk_table
 
     def __init__(self, model_doc):
         # setup null model objects for lookups that are not known to this limited model;
@@ -64,21 +83,15 @@ class ModelStub:
         unknown_schema = ModelStub._SchemaStub(self, None, {'tables': {None: {}}})
         self._unknown_table = unknown_schema.tables[None]
         self._unknown_fkey = ModelStub._ForeignKeyStub(unknown_schema.tables[None], {})
-        # populate the schemas
-        self.schemas = {k: ModelStub._SchemaStub(self, k, v) for k, v in model_doc.get('schemas', {}).items()}
-        # digest the fkeys
-        self._digest_fkeys()
-
-    def _digest_fkeys(self):
-        """Populate the pk_table property of fkeys if known to the model."""
-        for schema in self.schemas.values():
-            for fkey in schema._fkeys.values():
-                ref_col = fkey._fkey_doc.get('referenced_columns', [{}])[0]
-                pk_sname, pk_tname = ref_col.get('schema_name'), ref_col.get('table_name')
-                if pk_sname in self.schemas and pk_tname in self.schemas[pk_sname].tables:
-                    fkey.pk_table = self.schemas[pk_sname].tables[pk_tname]
-                else:
-                    fkey.pk_table = self._unknown_table
+        # populate the schemas; fkeys resolve their referenced tables lazily
+        self.schemas = {k: ModelStub._SchemaStub(self, k, v) for k, v in model_doc.get('schemas', _empty_mapping).items()}
+
+    def _table(self, schema_name, table_name):
+        """Returns known table or otherwise the unknown table."""
+        try:
+            return self.schemas[schema_name].tables[table_name]
+        except KeyError:
+            return self._unknown_table
 
     def fkey(self, constraint_name):
         """Returns known fkeys or otherwise the unknown fkey."""
@@ -113,15 +126,6 @@ class SchemaStub (object):
         def make_extant_symbol(self, s, t):
             return
 
-        def prejson(self):
-            return {
-                'schemas': {
-                    '.': {
-                        'tables': {}
-                    }
-                }
-            }
-
     def __init__(self, name):
         """Initializes the schema stub.
 
@@ -1,11 +1,16 @@
 """Wrappers for containers and model objects.
 """
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence, ItemsView, ValuesView
+
+#: sentinel for missing attributes
+_missing = object()
 
 
 class IteratorWrapper (Iterator):
     """Provides wrapped objects from an underlying iterator.
     """
+    __slots__ = ('_item_wrapper', '_iterator')
+
     def __init__(self, item_wrapper, iterator):
         """Initializes the wrapped iterator.
 
@@ -19,9 +24,30 @@ class IteratorWrapper (Iterator):
         return self._item_wrapper(next(self._iterator))
 
 
+class _MappingWrapperValuesView (ValuesView):
+    """Values view that iterates the values of the underlying mapping, rather than looking up each key.
+    """
+    __slots__ = ()
+
+    def __iter__(self):
+        return map(self._mapping._item_wrapper, self._mapping._mapping.values())
+
+
+class _MappingWrapperItemsView (ItemsView):
+    """Items view that iterates the items of the underlying mapping, rather than looking up each key.
+    """
+    __slots__ = ()
+
+    def __iter__(self):
+        item_wrapper = self._mapping._item_wrapper
+        return ((key, item_wrapper(value)) for key, value in self._mapping._mapping.items())
+
+
 class MappingWrapper (Mapping):
     """Provides wrapped objects from an underlying mapping.
     """
+    __slots__ = ('_item_wrapper', '_mapping')
+
     def __init__(self, item_wrapper, mapping):
         """Initializes the wrapped mapping.
 
@@ -40,6 +66,22 @@ class MappingWrapper (Mapping):
     def __len__(self):
         return len(self._mapping)
 
+    def __contains__(self, key):
+        # delegate to the mapping, rather than the mixin that wraps the item only to discard it
+        return key in self._mapping
+
+    def keys(self):
+        return self._mapping.keys()
+
+    def values(self):
+        return _MappingWrapperValuesView(self)
+
+    def items(self):
+        return _MappingWrapperItemsView(self)
+
+    def _ipython_key_completions_(self):
+        return self._mapping.keys()
+
     def __eq__(self, other):
         return self._mapping == other._mapping if isinstance(other, MappingWrapper) else False
 
@@ -47,6 +89,8 @@ class MappingWrapper (Mapping):
 class SequenceWrapper (Sequence):
     """Provides wrapped objects from an underlying sequence.
     """
+    __slots__ = ('_item_wrapper', '_sequence')
+
     def __init__(self, item_wrapper, sequence):
         """Initializes the wrapped sequence.
 
@@ -71,30 +115,48 @@ class SequenceWrapper (Sequence):
     def __len__(self):
         return len(self._sequence)
 
+    def __iter__(self):
+        # delegate to the sequence's iterator, rather than the mixin that indexes each element in turn
+        return map(self._item_wrapper, self._sequence)
+
     def __eq__(self, other):
         return self._sequence == other._sequence if isinstance(other, SequenceWrapper) else False
 
     def __contains__(self, item):
         if isinstance(item, ModelObjectWrapper):
             item = item._wrapped_obj
+        elif isinstance(item, str):
+            # keyed lists (e.g., of columns) are tested by name, using their mapping of names to elements
+            elements = getattr(self._sequence, 'elements', None)
+            if elements is not None:
+                return item in elements
         return item in self._sequence
 
 
 class ModelObjectWrapper (object):
     """Generic wrapper for an ermrest_model object.
     """
+
+    #: names of attributes of the wrapped object that may be patched onto the wrapper
+    _patch_attr_names = frozenset(('acls', 'acl_bindings', 'annotations', 'alter', 'apply', 'clear', 'drop', 'prejson', 'names', 'constraint_name'))
+
     def __init__(self, obj):
         """Initializes the wrapper.
 
         :param obj: the underlying ermrest_model object instance.
         """
-        super(ModelObjectWrapper, self).__init__()
+        # note: object.__init__ is not called, as it does nothing and wrappers are made on every access of model lists
         self._wrapped_obj = obj
 
-        # patch this wrapper object with attributes from the wrapped object
-        for attr_name in ['acls', 'acl_bindings', 'annotations', 'alter', 'apply', 'clear', 'drop', 'prejson', 'names', 'constraint_name']:
-            if not hasattr(self, attr_name) and hasattr(obj, attr_name):
-                setattr(self, attr_name, getattr(obj, attr_name))
+    def __getattr__(self, name):
+        # only reached for attributes not found by normal lookup, i.e., not defined by the wrapper class; patchable
+        # attributes are taken from the wrapped object on first access and patched onto this wrapper object
+        if name in ModelObjectWrapper._patch_attr_names:
+            value = getattr(self.__dict__.get('_wrapped_obj'), name, _missing)
+            if value is not _missing:
+                setattr(self, name, value)
+                return value
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
 
     def __repr__(self):
         return super(ModelObjectWrapper, self).__repr__() + f' named "{self.name}"'
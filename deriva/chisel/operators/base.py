@@ -7,11 +7,10 @@ from itertools import chain
 import json
 import logging
 from operator import itemgetter
-from pprint import pprint
 import warnings
 from deriva.core import ermrest_model as _em
 from ..optimizer import symbols
-from ..catalog.stubs import ModelStub
+from ..catalog.stubs import ModelStub, _empty_mapping
 from .. import mmo
 
 logger = logging.getLogger(__name__)
@@ -26,6 +25,18 @@ def _make_constraint_name(tname, *cnames, suffix=''):
     return constraint_name[:63 - len(suffix)] + f'_{suffix}'  # max supported length
 
 
+def _similarity_batch(similarity_fn):
+    """Returns the batch form of a similarity function, which compares one value to each of a list of values.
+
+    :param similarity_fn: a similarity function, which may provide its own `batch` form
+    :return: a function of a value and a list of values, returning the list of their similarities
+    """
+    batch = getattr(similarity_fn, 'batch', None)
+    if batch is not None:
+        return batch
+    return lambda value, values: [similarity_fn(value, value2) for value2 in values]
+
+
 #
 # Physical operator (abstract) base class definition
 #
@@ -36,6 +47,9 @@ class PhysicalOperator:
     A physical operator has two primary purposes:
       1. it should determine the table definition (i.e., relation schema) of the computed relation; and
       2. it must compute the relation using an iterator pattern, which should efficiently yield its rows.
+
+    Rows are pulled through a plan one at a time, so an operator should only hold onto rows when it cannot produce its
+    output otherwise (e.g., distinct, similarity aggregation, or the inner relation of a join).
     """
     def __init__(self):
         super(PhysicalOperator, self).__init__()
@@ -46,12 +60,10 @@ class PhysicalOperator:
         """
         # This method will return the instance's `_description` if it has one, if not it will return this instance's
         # `_child.description` if child is defined, else will return `None`.
-        if hasattr(self, '_description'):
+        try:
             return self._description
-        elif hasattr(self, '_child') and hasattr(self._child, 'description'):
-            return self._child.description
-        else:
-            return None
+        except AttributeError:
+            return getattr(getattr(self, '_child', None), 'description', None)
 
     @abc.abstractmethod
     def __iter__(self):
@@ -85,22 +97,28 @@ class PhysicalOperator:
 #
 
 class BufferedOperator (PhysicalOperator):
-    """Buffers the tuples generated by an arbitrary child operator."""
+    """Buffers the tuples generated by an arbitrary child operator.
+
+    The first complete iteration streams the child's tuples as they are buffered; later iterations replay the buffer.
+    """
     def __init__(self, child):
         super(BufferedOperator, self).__init__()
         assert isinstance(child, PhysicalOperator)
         self._child = child
         self._buffer = collections.deque()
+        self._buffered = False  # set when the child has been fully buffered
 
     def __iter__(self):
         # This is not intended to be re-entrant, but could be made so if needed
-        if self._buffer:
-            for item in self._buffer:
-                yield item
+        if self._buffered:
+            yield from self._buffer
         else:
+            # (re)fill the buffer, in case a previous iteration was abandoned before exhausting the child
+            self._buffer.clear()
             for item in self._child:
                 self._buffer.append(item)
                 yield item
+            self._buffered = True
 
 
 class Metadata (PhysicalOperator):
@@ -122,7 +140,11 @@ class TempVarRef (PhysicalOperator):
         self._computed_relation = computed_relation
 
     def __iter__(self):
-        return iter(self._computed_relation.fetch())
+        # the temporary variable is computed once per commit and its rows are replayed for each of its references
+        computed_relation = self._computed_relation
+        if computed_relation._materialized is None:
+            computed_relation._materialized = list(computed_relation.fetch())
+        return iter(computed_relation._materialized)
 
 
 #
@@ -215,9 +237,39 @@ class Select (PhysicalOperator):
         else:
             self._connector_fn = all
 
+        # a disjunction of equality comparisons on one attribute (i.e., an 'in' list) is evaluated by set membership;
+        # only operands of one exact type are hashed, as mixed types (e.g., 1, 1.0 and True) would share set entries
+        self._membership = None
+        if isinstance(formula, symbols.Disjunction) and len(self._comparisons) > 1 and \
+                all(comparison.operator == 'eq' for comparison in self._comparisons) and \
+                len({comparison.operand1 for comparison in self._comparisons}) == 1 and \
+                len({type(comparison.operand2) for comparison in self._comparisons}) == 1:
+            try:
+                self._membership = (
+                    self._comparisons[0].operand1,
+                    type(self._comparisons[0].operand2),
+                    frozenset(comparison.operand2 for comparison in self._comparisons)
+                )
+            except TypeError:
+                pass  # unhashable operands, evaluate the comparisons instead
+
     def __iter__(self):
+        if self._membership:
+            return filter(self._eval_membership, self._child)
         return filter(self._eval_formula, self._child)
 
+    def _eval_membership(self, row):
+        """Evaluates the current row against the select operator's 'in' list.
+        """
+        attribute, operand_type, values = self._membership
+        value = row[attribute]
+        if type(value) is not operand_type:
+            return self._eval_formula(row)  # values of other types are compared as the formula would compare them
+        try:
+            return value in values
+        except TypeError:
+            return self._eval_formula(row)  # unhashable value
+
     def _eval_comparison(self, row: dict, comparison: symbols.Comparison):
         """Evaluates a single comparison.
         """
@@ -443,7 +495,7 @@ class Rename (Project):
         assert isinstance(child, PhysicalOperator)
         assert child.description
         assert isinstance(renames, tuple)
-        assert all([isinstance(rename, symbols.AttributeAlias) for rename in renames])
+        assert all(isinstance(rename, symbols.AttributeAlias) for rename in renames)
 
         # compile list of renames, and handle >1 alias per original column
         rename_dict = collections.defaultdict(list)
@@ -493,10 +545,10 @@ class Union (PhysicalOperator):
         assert isinstance(child, PhysicalOperator)
         assert isinstance(other, PhysicalOperator)
         other_columns = {c['name']: c for c in other.description['column_definitions']}
-        if any([
+        if any(
             c['name'] not in other_columns or c != other_columns[c['name']]
             for c in child.description['column_definitions']
-        ]):
+        ):
             raise ValueError('Column definitions between tables in a union operation must match')
         self._child = child
         self._other = other
@@ -542,22 +594,21 @@ class NestedLoopsSimilarityAggregation (Project):
         key_getter = itemgetter(*self._grouping)
         nested_getter = itemgetter(*self._nesting) if self._nesting else None
 
-        # keep a local cache of rows, b/c it will be iterated repeatedly
-        rows = []
+        # keep a local cache of rows and their keys, b/c they will be iterated repeatedly
+        rows = list(self._child)
+        keys = [key_getter(row) for row in rows]
         # keep track of each key's membership in a group (i.e., grouping reverse index)
-        member_of_list = []
-        for row in self._child:
-            rows.append(row)
-            member_of_list.append({'key': key_getter(row), 'member_of': None})
+        member_of = [None] * len(rows)
 
-        # accumulate groups
+        # accumulate groups, comparing each key to the keys not yet in a group in one batch
+        similarities = _similarity_batch(self._similarity_fn)
         groups = {}
-        for row in rows:
-            key1 = key_getter(row)
-            for i, candidate in enumerate(member_of_list):
-                if not candidate['member_of'] and self._similarity_fn(key1, candidate['key']) < 1.0:
+        for key1 in keys:
+            candidates = [i for i, group_key in enumerate(member_of) if not group_key]
+            for i, similarity in zip(candidates, similarities(key1, [keys[i] for i in candidates])):
+                if similarity < 1.0:
                     # update the reverse index of groups
-                    candidate['member_of'] = key1
+                    member_of[i] = key1
                     # update the groups, by getting the corresponding i-th row and adding it to the group
                     if self._nesting:
                         group = groups.get(key1, set())
@@ -599,11 +650,12 @@ class Unnest (Project):
                 break
 
     def __iter__(self):
+        attribute, unnest_fn = self._attribute, self._unnest_fn
         for row in self._child:
-            for atom in self._unnest_fn(row[self._attribute]):
+            for atom in unnest_fn(row[attribute]):
                 # for each generated value produced by the unnest function, yield a copied row with the yielded atom
                 copy = row.copy()
-                copy[self._attribute] = atom
+                copy[attribute] = atom
                 yield copy
 
 
@@ -688,29 +740,20 @@ class NestedLoopsSimilarityJoin (CrossJoin):
 
     def __iter__(self):
         # TODO use grouping function to improve algorithm by comparing rows within sub-groups only
-        right_rows = list(self._right)  # cache a copy of the right rows
+        # compile the domain names and synonyms of the right rows once, with the row of each term
+        terms, term_rows = [], []
+        for right_row in self._right:
+            synonyms = right_row[self._synonyms] if right_row[self._synonyms] is not None else []
+            for term in [right_row[self._domain]] + synonyms:
+                terms.append(term)
+                term_rows.append(right_row)
+
+        similarities = _similarity_batch(self._similarity_fn)
         for left_row in self._left:
-            target = left_row[self._target]
-            best_match_score = 1.0
-            best_match_row = None
-
-            # look for the best match in the right_rows
-            for right_row in right_rows:
-                # compile list of domain name and synonyms
-                synonyms = right_row[self._synonyms] if right_row[self._synonyms] is not None else []
-                domain_and_synonyms = [right_row[self._domain]] + synonyms
-                # test similarity of domain and synonyms
-                for term in domain_and_synonyms:
-                    similarity = self._similarity_fn(target, term)
-                    if similarity < best_match_score:
-                        best_match_score = similarity
-                        best_match_row = right_row
-                        if similarity == 0.0:
-                            # found best possible match, stop comparing
-                            break
-                if best_match_score == 0.0:
-                    # found best possible match, stop comparing
-                    break
+            # the best match is the row of the first of the most similar terms, if any are similar at all
+            scores = similarities(left_row[self._target], terms)
+            best_match_score = min(scores, default=1.0)
+            best_match_row = term_rows[scores.index(best_match_score)] if best_match_score < 1.0 else None
 
             if best_match_row:
                 # only yield a row if a near match was satisfied
@@ -735,6 +778,20 @@ class IntegrityConstraintModificationOperator (PhysicalOperator):
     def __iter__(self):
         return iter(self._child)
 
+    def _copy_description(self):
+        """Sets a shallow copy of the child's description; subclasses must copy any nested part before changing it.
+        """
+        self._description = dict(self._child.description)
+
+    def _set_default_vizcols(self, vizcols):
+        """Sets the default visible-columns, copying the annotations shared with the child's description.
+        """
+        annotations = self._description['annotations']
+        self._description['annotations'] = {
+            **annotations,
+            _em.tag.visible_columns: {**annotations[_em.tag.visible_columns], '*': vizcols}
+        }
+
 
 class AddKey (IntegrityConstraintModificationOperator):
     """Add Key constraint operator.
@@ -755,18 +812,18 @@ class AddKey (IntegrityConstraintModificationOperator):
         assert isinstance(unique_columns, list) and isinstance(next(iter(unique_columns)), str), '"unique_columns" must be a list of column names'
         logger.debug('unique_columns: %s' % str(unique_columns))
         self._child = child
-        self._description = deepcopy(child.description)
+        self._copy_description()
         # add key definition to table description
         key_name = [self._description.get('schema_name', __sname_placeholder__), _make_constraint_name(__tname_placeholder__, *unique_columns, suffix='key')]
-        self._description['keys'].append(
+        self._description['keys'] = self._description['keys'] + [
             _em.Key.define(unique_columns, constraint_names=[key_name])
-        )
+        ]
         # replace unique columns with key name in the default visible-columns
-        vizcols = self._description.get('annotations', {}).get(_em.tag.visible_columns, {}).get('*')
+        vizcols = self._description.get('annotations', _empty_mapping).get(_em.tag.visible_columns, _empty_mapping).get('*')
         if isinstance(vizcols, list):
             vizcols = [item for item in vizcols if item not in unique_columns]
             vizcols.append(key_name)
-            self._description['annotations'][_em.tag.visible_columns]['*'] = vizcols
+            self._set_default_vizcols(vizcols)
 
 
 class DropConstraint (IntegrityConstraintModificationOperator):
@@ -788,7 +845,7 @@ class DropConstraint (IntegrityConstraintModificationOperator):
         super(DropConstraint, self).__init__(child)
         assert isinstance(child, PhysicalOperator)
         logger.debug('dropping constraint name: %s' % constraint_name)
-        self._description = deepcopy(child.description)
+        self._copy_description()
         if constraint_name == symbols.AllConstraints:
             # clear all constraints of this type
             self._description[constraint_type] = []
@@ -830,7 +887,7 @@ class AddForeignKey (IntegrityConstraintModificationOperator):
         assert referenced_columns, '"referenced_columns" contain at least one column name or function'
         logger.debug('referenced_columns: %s' % referenced_columns)
         self._child = left
-        self._description = deepcopy(left.description)
+        self._copy_description()
 
         # pk table may be a table object or a physical operator
         pk_table_def = right.prejson() if hasattr(right, 'prejson') else right.description
@@ -852,7 +909,7 @@ class AddForeignKey (IntegrityConstraintModificationOperator):
 
         # define and append fkey
         fkey_name = [self._description.get('schema_name', __sname_placeholder__), _make_constraint_name(__tname_placeholder__, *foreign_key_columns, suffix='fkey')]
-        self._description['foreign_keys'].append(
+        self._description['foreign_keys'] = self._description['foreign_keys'] + [
             _em.ForeignKey.define(
                 foreign_key_columns,
                 pk_table_def['schema_name'],
@@ -861,9 +918,9 @@ class AddForeignKey (IntegrityConstraintModificationOperator):
                 on_update='CASCADE',
                 constraint_names=[fkey_name]
             )
-        )
+        ]
 
         # add fkey to default visible-columns
-        vizcols = self._description.get('annotations', {}).get(_em.tag.visible_columns, {}).get('*')
+        vizcols = self._description.get('annotations', _empty_mapping).get(_em.tag.visible_columns, _empty_mapping).get('*')
         if isinstance(vizcols, list):
-            vizcols.append(fkey_name)
+            self._set_default_vizcols(vizcols + [fkey_name])
@@ -51,14 +51,14 @@ class ERMrestSelectProject (Project):
     def __init__(self, model, sname, tname, projection=None, formula=None):
         """Initialize the operator.
 
-        :param model: an ermrest Model object
+        :param model: a catalog model object
         :param sname: schema name
         :param tname: table name
         :param projection: list of attributes to be returned in tuples
         :param formula: expression for filtering tuples
         """
         super(ERMrestSelectProject, self).__init__(
-            Metadata(deepcopy(model.schemas[sname].tables[tname].prejson())),
+            Metadata(deepcopy(model._table(sname, tname).prejson())),
             projection
         )
         self._description['schema_name'] = sname
@@ -88,13 +88,13 @@ class ERMrestSelect (PhysicalOperator):
     def __init__(self, model, sname, tname, formula=None):
         """Initialize the operator.
 
-        :param model: an ermrest Model object
+        :param model: a catalog model object
         :param sname: schema name
         :param tname: table name
         :param formula: where-clause formula
         """
         super(ERMrestSelect, self).__init__()
-        self._description = deepcopy(model.schemas[sname].tables[tname].prejson())
+        self._description = deepcopy(model._table(sname, tname).prejson())
         self._description['schema_name'] = sname
         self._model = model
         self._sname = sname
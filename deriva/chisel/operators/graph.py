@@ -2,7 +2,6 @@
 
 from copy import deepcopy
 import logging
-import rdflib as _rdflib
 from pyparsing import Word, CaselessKeyword, alphanums, OneOrMore, Literal, SkipTo
 from deriva.core import ermrest_model as _em
 from .base import PhysicalOperator
@@ -30,8 +29,8 @@ class Shred (PhysicalOperator):
         :param expression: text of a SPARQL expression
         :param kwargs: keyword arguments
         """
-        assert graph, "Invalid value for 'graph'"
-        assert expression, "Invalid value for 'expression'"
+        assert graph is not None and not (isinstance(graph, str) and not graph), "Invalid value for 'graph'"
+        assert isinstance(expression, str) and expression, "Invalid value for 'expression'"
         super(Shred, self).__init__()
         self._graph = graph
         self._expression = expression
@@ -51,6 +50,7 @@ class Shred (PhysicalOperator):
 
     @property
     def _parsed_graph(self):
+        import rdflib as _rdflib  # deferred so that rdflib is only imported when a graph is actually used
         # if graph is a string, assume its a filename, else assume its a rdflib.Graph object
         if isinstance(self._graph, type('str')) or isinstance(self._graph, type('unicode')):
             graph = _rdflib.Graph()
@@ -74,6 +74,7 @@ class Shred (PhysicalOperator):
         :param expression: SPARQL query string
         :return: table definition
         """
+        import rdflib as _rdflib
         assert isinstance(graph, _rdflib.Graph)
         results = graph.query(expression)
         col_defs = [
@@ -7,6 +7,7 @@ import json
 import logging
 import os
 import re
+import sys
 from deriva.core import ermrest_model as _em
 from .base import PhysicalOperator
 
@@ -16,6 +17,39 @@ logger = logging.getLogger(__name__)
 _default_key_regex = '^RID$|^ID$|^Name$|^Key$|^pk$'
 
 
+def _csv_dialect(filename):
+    """Returns the csv dialect for a tabular file; 'excel' for '.csv' files, otherwise 'excel-tab'.
+
+    :param filename: a filename
+    :return: name of the csv dialect
+    """
+    return 'excel' if filename.endswith('.csv') else 'excel-tab'
+
+
+def _intern_names(names):
+    """Returns the attribute names interned, so that the rows and descriptions of a scan share the same name objects.
+
+    :param names: attribute names
+    :return: list of interned attribute names
+    """
+    return [sys.intern(name) if type(name) is str else name for name in names]
+
+
+def _introspect_defs(names, key_regex):
+    """Returns text column definitions and single column key definitions for the given attribute names.
+
+    :param names: attribute names
+    :param key_regex: a regular expression used to guess a key column from a property name
+    :return: (column definitions, key definitions)
+    """
+    names = _intern_names(names)
+    text_type = _em.builtin_types['text']
+    key_pattern = re.compile(key_regex, re.IGNORECASE)
+    col_defs = [_em.Column.define(name, text_type) for name in names]
+    key_defs = [_em.Key.define([name]) for name in names if key_pattern.match(name)]
+    return col_defs, key_defs
+
+
 class JSONScan (PhysicalOperator):
     """Scan operator for JSON files and text payloads."""
     def __init__(self, input_filename=None, json_content=None, object_payload=None, key_regex=_default_key_regex):
@@ -44,15 +78,14 @@ class JSONScan (PhysicalOperator):
             self._data = object_payload
             table_name = 'PYTHON_OBJECT'
 
-        if not isinstance(self._data, list) and len(self._data) and isinstance(self._data[0], dict):
-            raise ValueError('Input source must be a non-empty array of objects')
+        if not isinstance(self._data, list) or (self._data and not isinstance(self._data[0], dict)):
+            raise ValueError('Input source must be an array of objects')
 
         # make sure key_regex has a default value
         key_regex = key_regex if key_regex else _default_key_regex
 
         row_0_keys = self._data[0].keys() if self._data else []
-        col_defs = [_em.Column.define(name, _em.builtin_types['text']) for name in row_0_keys]
-        key_defs = [_em.Key.define([name]) for name in row_0_keys if re.match(key_regex, name, re.IGNORECASE)]
+        col_defs, key_defs = _introspect_defs(row_0_keys, key_regex)
         if not key_defs:
             logger.warning("Expected to find at least one key, but none were identified.")
         self._description = _em.Table.define(table_name, column_defs=col_defs, key_defs=key_defs, provide_system=False)
@@ -66,28 +99,31 @@ class JSONScan (PhysicalOperator):
 class TabularFileScan (PhysicalOperator):
     """Scan operator for tabular file formats (e.g., CSV, TSV, or other similar formats)."""
 
-    #: schema cache to avoid multiple file seeks for same input file; keyed on 'filename'
+    #: schema cache to avoid multiple file seeks for same input file; keyed on (filename, key_regex, deep_introspection)
     _schema_cache = {}
 
     def __init__(self, filename, key_regex=_default_key_regex, deep_introspection=False):
         super(TabularFileScan, self).__init__()
         self._filename = filename
-        self._dialect = 'excel' if filename.endswith('.csv') else 'excel-tab'  # csv or tabular dialect expected
+        self._dialect = _csv_dialect(filename)
         self._key_regex = key_regex if key_regex else _default_key_regex  # make sure key_regex has a default value
 
-        if filename in TabularFileScan._schema_cache:
-            self._description = deepcopy(TabularFileScan._schema_cache[filename])
+        cache_key = (filename, self._key_regex, bool(deep_introspection))
+        if cache_key in TabularFileScan._schema_cache:
+            self._description = deepcopy(TabularFileScan._schema_cache[cache_key])
         else:
             # shallow introspection of relation schema based on field names
             self._description = self._shallow_introspection()
             if deep_introspection:
                 self._deep_introspection()
-            TabularFileScan._schema_cache[filename] = self._description
+            TabularFileScan._schema_cache[cache_key] = self._description
 
     def __iter__(self):
         """Returns a generator function."""
         with open(self._filename) as file:
             reader = csv.DictReader(file, dialect=self._dialect)
+            if reader.fieldnames:
+                reader.fieldnames = _intern_names(reader.fieldnames)
             for line in reader:
                 yield line
 
@@ -95,8 +131,7 @@ class TabularFileScan (PhysicalOperator):
         # shallow introspection of relation schema based on field names
         with open(self._filename) as f:
             field_names = csv.DictReader(f, dialect=self._dialect).fieldnames
-            col_defs = [_em.Column.define(name, _em.builtin_types['text']) for name in field_names]
-            key_defs = [_em.Key.define([name]) for name in field_names if re.match(self._key_regex, name, re.IGNORECASE)]
+        col_defs, key_defs = _introspect_defs(field_names, self._key_regex)
         table_doc = _em.Table.define(self._filename, col_defs, key_defs, provide_system=False)
         table_doc['schema_name'] = os.path.dirname(self._filename)
         table_doc['kind'] = 'file'
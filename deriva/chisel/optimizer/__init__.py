@@ -1,7 +1,7 @@
 """Expression planner and optimizer."""
 
+from collections import OrderedDict
 from pyfpm import matcher as _fpm
-from . import rules as _rules
 from .symbols import *
 from .consolidate import consolidate
 
@@ -21,13 +21,25 @@ def _execute_rules_single_pass(rules, op):
     try:
         op = rules(op)
     except _fpm.NoMatch:
-        # recursively rewrite the children
+        # recursively rewrite the children, preserving the identity of this operator if none of its children changed
+        changed = False
         for child in ['child', 'left', 'right']:
-            if hasattr(op, child):
+            original = getattr(op, child, None)
+            if original is not None:
                 try:
-                    op = op._replace(**{child: _execute_rules_single_pass(rules, getattr(op, child))})
+                    rewritten = _execute_rules_single_pass(rules, original)
+                    if rewritten is not original:
+                        op = op._replace(**{child: rewritten})
+                        changed = True
                 except _fpm.NoMatch:
                     pass
+        # retry this operator with its rewritten children, rather than waiting for the next pass (which would make
+        # rewriting a plan bottom-up, as the physical planner does, take as many passes as the plan is deep)
+        if changed:
+            try:
+                op = rules(op)
+            except _fpm.NoMatch:
+                pass
 
     # return the rewritten plan
     return op
@@ -43,21 +55,123 @@ def _execute_rules(rules, plan):
     while True:
         temp = plan
         plan = _execute_rules_single_pass(rules, temp)
-        if str(temp) == str(plan):
+        if plan is temp or str(temp) == str(plan):
             # stop when a fixed point is reached
             break
     return plan
 
 
-def logical_planner(plan):
+class _PlanKey (object):
+    """Key of a symbol, which computes its hash once (see `PlanMemo.key`).
+    """
+    __slots__ = ('_key', '_hash')
+
+    def __init__(self, key):
+        self._key = key
+        self._hash = hash(key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, _PlanKey) and self._hash == other._hash and self._key == other._key
+        )
+
+
+class PlanMemo (object):
+    """Memo of rewritten logical plans, in least recently used order (see `logical_planner`).
+
+    Memoized plans hold their extant symbols, and through them their models and payloads, so a memo is kept by the
+    model whose relations it plans rather than globally, and it is cleared when that model commits new relations.
+    """
+
+    #: maximum number of memoized logical plans
+    size = 128
+
+    #: maximum number of remembered symbol keys
+    keys_size = 1024
+
+    def __init__(self):
+        self._plans = OrderedDict()  # rewritten plans keyed on `key(plan)`
+        self._keys = OrderedDict()  # keys of recently keyed symbols by identity, with the symbols themselves
+
+    def __len__(self):
+        return len(self._plans)
+
+    def clear(self):
+        """Forgets the memoized plans and symbol keys."""
+        self._plans.clear()
+        self._keys.clear()
+
+    def key(self, plan):
+        """Returns a hashable key for a plan.
+
+        Unlike the plan itself, the key distinguishes the types of its symbols (e.g., `Nil()` and `AllAttributes()`
+        compare as equal tuples) and values (e.g., `1` and `True`). Keys of symbols are remembered by identity (keeping
+        the symbols alive, so that their identities remain valid), so that keying a plan that extends a recently keyed
+        plan (e.g., a chain of computed relations) only keys the new symbols.
+
+        :param plan: logical plan
+        :return: hashable key, or raises TypeError if the plan is not hashable
+        """
+        if isinstance(plan, tuple):
+            if type(plan) is tuple:
+                return (tuple,) + tuple(self.key(item) for item in plan)
+            remembered = self._keys.get(id(plan))
+            if remembered is not None and remembered[0] is plan:
+                return remembered[1]
+            key = _PlanKey((type(plan),) + tuple(self.key(item) for item in plan))
+            self._keys[id(plan)] = (plan, key)
+            if len(self._keys) > self.keys_size:
+                self._keys.popitem(last=False)
+            return key
+        hash(plan)
+        return type(plan), plan
+
+
+def logical_planner(plan, memo=None):
     """Logical planner.
 
     The logical planner function rewrites the child logical plan by first 'composing' (transforming) a composite
     logical plan into a primitive logical plan, then 'consolidating' the primitive logical plan.
 
+    Since the logical rules are pure functions of the (immutable) symbolic plan, rewritten plans may be memoized. Plans
+    that are not hashable (e.g., those with python object payloads) are always rewritten. A rewritten plan is already
+    canonical, so it is also memoized as its own rewritten plan, and planning it again (e.g., when a committed plan is
+    reused) does not execute the rules.
+
     :param plan: logical plan.
+    :param memo: memo of rewritten plans (optional)
     :return The rewritten logical plan.
     """
+    if memo is None:
+        return _logical_planner(plan)
+
+    try:
+        key = memo.key(plan)
+    except TypeError:
+        return _logical_planner(plan)
+
+    plans = memo._plans
+    if key in plans:
+        plans.move_to_end(key)
+        return plans[key]
+
+    plans[key] = rewritten = _logical_planner(plan)
+    if rewritten is not plan:
+        try:
+            plans[memo.key(rewritten)] = rewritten
+        except TypeError:
+            pass  # not hashable, so it will be rewritten (to itself) if planned again
+    while len(plans) > memo.size:
+        plans.popitem(last=False)
+    return rewritten
+
+
+def _logical_planner(plan):
+    """Rewrites the plan according to the composition and then the optimization rules (see `logical_planner`)."""
+    from . import rules as _rules  # deferred, compiling the rules is the dominant cost of importing the optimizer
     # rewrite according to composite rules
     plan = _execute_rules(_rules.logical_composition_rules, plan)
     # rewrite according to logical optimization rules
@@ -73,6 +187,7 @@ def physical_planner(plan):
     :param plan: logical plan
     :return: physical plan
     """
+    from . import rules as _rules
     return _execute_rules(_rules.physical_transformation_rules, plan)
 
 
@@ -26,41 +26,42 @@ def _count_plans(computed_relations):
                 continue
             # if this sub-plan hasn't been seen, add its (child) sub-plans to the queue
             for child in ['child', 'left', 'right']:
-                if hasattr(plan, child):
-                    plans.append(getattr(plan, child))
+                sub_plan = getattr(plan, child, None)
+                if sub_plan is not None:
+                    plans.append(sub_plan)
     # return counts of plans
     return counts
 
 
-def _consolidate_plan(parent, plan, counts, tempvars):
+def _consolidate_plan(parent, plan, counts, tempvars, new_tempvars):
     """Consolidates the subexpressions in a plan and generates new temporary variables, as needed.
 
     :param parent: parent computed relation being consolidated
     :param plan: current logical sub-plan to be consolidated
     :param counts: count of sub-plan occurrences
     :param tempvars: dictionary of known temporary variables, which will be updated as needed
-    :return: (rewritten logical plan, new temporary vars dictionary)
+    :param new_tempvars: list to which newly generated temporary variables will be appended
+    :return: rewritten logical plan
     """
     if counts[plan] > 1:
         logger.debug('Found shared work: {plan}'.format(plan=str(plan)))
         if plan in tempvars and tempvars[plan] != parent:
             logger.debug('Found existing tempvar for this sub-plan')
             # re-write the plan as a reference to the temporary var
-            return TempVar(tempvars[plan]), []
+            return TempVar(tempvars[plan])
         else:
             logger.debug('Temp var for this plan not found, generating a new temp var.')
             tempvars[plan] = tempvar = ext.ComputedRelation(parent.schema, plan)
-            return TempVar(tempvar), [tempvar]
+            new_tempvars.append(tempvar)
+            return TempVar(tempvar)
 
     # recursively rewrite the children
-    new_tempvars = []
     for child in ['child', 'left', 'right']:
-        if hasattr(plan, child):
-            child_plan, child_vars = _consolidate_plan(parent, getattr(plan, child), counts, tempvars)
-            plan = plan._replace(**{child: child_plan})
-            new_tempvars.extend(child_vars)
+        sub_plan = getattr(plan, child, None)
+        if sub_plan is not None:
+            plan = plan._replace(**{child: _consolidate_plan(parent, sub_plan, counts, tempvars, new_tempvars)})
     # return the rewritten plan
-    return plan, new_tempvars
+    return plan
 
 
 def consolidate(computed_relations):
@@ -79,11 +80,9 @@ def consolidate(computed_relations):
         counts = _count_plans(unconsolidated)
         unconsolidated_tempvars = []  # keep track of new temp vars that need consolidation
         for computed_relation in unconsolidated:
-            # rewrite the logical plan with tempvars where possible
-            computed_relation.logical_plan, new_tempvars = \
-                _consolidate_plan(computed_relation, computed_relation.logical_plan, counts, tempvars)
-            # update list of unconsolidated temp vars
-            unconsolidated_tempvars.extend(new_tempvars)
+            # rewrite the logical plan with tempvars where possible, accumulating new temp vars
+            computed_relation.logical_plan = _consolidate_plan(
+                computed_relation, computed_relation.logical_plan, counts, tempvars, unconsolidated_tempvars)
         # replace current set of unconsolidated work, with temp vars that will be further refined
         unconsolidated = unconsolidated_tempvars
     # return temporary variables that were accumulated during the consolidation
@@ -53,6 +53,50 @@ def _rewrite_formula(formula, projection):
         return formula
 
 
+def _fuse_renames(child, attributes, renames):
+    """Fuses renames into a projection of the child relation.
+
+    :param child: the child relation of the projection
+    :param attributes: the projection list
+    :param renames: a tuple of attribute aliases
+    :return: the fused projection
+    """
+    renamed = {r.name for r in renames}
+    return Project(child, tuple([
+        a for a in attributes if not (isinstance(a, str) and a in renamed)
+    ]) + renames)
+
+
+def _compose_renames(child, inner, outer):
+    """Composes consecutive renames into a single rename of the child relation.
+
+    :param child: the child relation of the inner rename
+    :param inner: a tuple of attribute aliases applied first
+    :param outer: a tuple of attribute aliases applied to the result of the inner renames
+    :return: the composed rename
+    """
+    aliases = {}
+    for r in outer:
+        aliases.setdefault(r.name, []).append(r.alias)
+    composed = [
+        AttributeAlias(r.name, alias) for r in inner for alias in aliases.pop(r.alias, (r.alias,))
+    ]
+    # outer renames of attributes that the inner renames renamed away (and did not re-introduce) have nothing to rename
+    renamed = {r.name for r in inner}
+    return Rename(child, tuple(composed) + tuple([r for r in outer if r.name in aliases and r.name not in renamed]))
+
+
+def _is_drop_projection(attributes):
+    """Tests if a projection list is all attributes less zero or more dropped attributes.
+
+    :param attributes: a projection list
+    :return: True if the projection only drops attributes
+    """
+    return bool(attributes) and isinstance(attributes[0], AllAttributes) and all(
+        isinstance(a, AttributeDrop) for a in attributes[1:]
+    )
+
+
 #
 # Planning and optimization rules
 #
@@ -81,9 +125,15 @@ logical_optimization_rules = Matcher([
     ),
     (
         'Rename(Project(child, attributes), renames)',
-        lambda child, attributes, renames: Project(child, tuple([
-            a for a in attributes if a not in [r.name for r in renames]
-        ]) + renames)
+        _fuse_renames
+    ),
+    (
+        'Rename(Rename(child, inner), outer)',
+        _compose_renames
+    ),
+    (
+        'Project(Project(child, inner), outer) if _is_drop_projection(inner) and _is_drop_projection(outer)',
+        lambda child, inner, outer: Project(child, inner + outer[1:])
     ),
     (
         'Select(Nil(), _)',
@@ -147,6 +197,19 @@ logical_composition_rules = Matcher([
         'Atomize(child, unnest_fn, attribute)',
         lambda child, unnest_fn, attribute: Unnest(ReifySub(child, (attribute,)), unnest_fn, attribute)
     ),
+    (
+        # domain of an atomized attribute needs only that attribute, not the reified (keyed and referencing) relation
+        'Domainify(Atomize(child, unnest_fn, attribute), domain_attribute, similarity_fn, grouping_fn)'
+        '   if attribute and attribute == domain_attribute',
+        lambda child, unnest_fn, attribute, domain_attribute, similarity_fn, grouping_fn:
+        Domainify(Unnest(Project(child, (attribute,)), unnest_fn, attribute), attribute, similarity_fn, grouping_fn)
+    ),
+    (
+        'Canonicalize(Atomize(child, unnest_fn, attribute), domain_attribute, similarity_fn, grouping_fn)'
+        '   if attribute and attribute == domain_attribute',
+        lambda child, unnest_fn, attribute, domain_attribute, similarity_fn, grouping_fn:
+        Canonicalize(Unnest(Project(child, (attribute,)), unnest_fn, attribute), attribute, similarity_fn, grouping_fn)
+    ),
     (
         'Domainify(child, attribute, similarity_fn, grouping_fn)',
         lambda child, attribute, similarity_fn, grouping_fn:
@@ -7,6 +7,21 @@ from collections import namedtuple
 # Internal helper functions
 #
 
+def _canonical_comparisons(comparisons):
+    """Returns the comparisons in a canonical order, without duplicates.
+
+    Conjunctions and disjunctions are commutative and idempotent, so that canonicalizing their comparisons makes
+    equivalent formulas (e.g., `a & b` and `b & a`) equal.
+
+    :param comparisons: a tuple of Comparison objects
+    :return: a tuple of Comparison objects
+    """
+    canonical = {
+        (c.operand1, c.operator, type(c.operand2).__name__, repr(c.operand2)): c for c in comparisons
+    }
+    return tuple(canonical[key] for key in sorted(canonical))
+
+
 def _and_fn(left, right):
     """A helper function for the bitwise and between conjunctions and/or comparisons.
 
@@ -29,7 +44,7 @@ def _and_fn(left, right):
             left=type(left).__name__, right=type(right).__name__
         ))
 
-    return Conjunction(comparisons)
+    return Conjunction(_canonical_comparisons(comparisons))
 
 
 def _or_fn(left, right):
@@ -54,7 +69,7 @@ def _or_fn(left, right):
             left=type(left).__name__, right=type(right).__name__
         ))
 
-    return Disjunction(comparisons)
+    return Disjunction(_canonical_comparisons(comparisons))
 
 
 #
@@ -168,8 +183,10 @@ DropForeignKey = namedtuple('DropForeignKey', 'child constraint_name')
 #: all constraints marker
 AllConstraints = namedtuple('AllConstraints', '')
 
-#: all attributes marker
+#: all attributes marker, which is a single shared instance as it has no fields
 AllAttributes = namedtuple('AllAttributes', '')
+_all_attributes = tuple.__new__(AllAttributes)
+AllAttributes.__new__ = staticmethod(lambda cls: _all_attributes)
 
 #: attribute alias parameter
 AttributeAlias = namedtuple('AttributeAlias', 'name alias')
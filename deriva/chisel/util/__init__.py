@@ -1,5 +1,6 @@
 """Utility functions (internal use)."""
 
+import functools
 import logging
 import nltk as _nltk
 import sys
@@ -10,25 +11,37 @@ from .graph import graph
 
 logger = logging.getLogger(__name__)
 
+try:
+    # optional, faster implementation of the (unit cost) Levenshtein distance
+    from rapidfuzz.distance.Levenshtein import distance as _edit_distance
+except ImportError:
+    _edit_distance = _nltk.edit_distance
+
 try:
     from urllib.parse import urlparse as urlparse
 except ImportError:
     from urlparse import urlparse as urlparse
 
 
+@functools.lru_cache(maxsize=32)
 def splitter_fn(delim):
     """Simple string spliter function builder.
 
     Creates a very simple string splitter function that splits an input string on the given `delim` character, then
-    strips whitespace, and yields the resultant values one at a time.
+    strips whitespace, and returns the resultant values as a list. The same function is returned for the same `delim`,
+    so that otherwise equal expressions that use it are planned only once.
 
     :param delim: delimiter character (e.g., ',')
     :return: splitter function
     """
+    strip = str.strip
+
     def splitter(s):
-        if s:
-            for v in s.split(delim):
-                yield v.strip()
+        if not s:
+            return []
+        if delim not in s:
+            return [strip(s)]  # single values (e.g., 'cat') are common, and need neither splitting nor mapping
+        return list(map(strip, s.split(delim)))
     return splitter
 
 
@@ -59,6 +72,11 @@ def introspect_key_fn(rel):
     return minkey['unique_columns'].copy()
 
 
+def _to_str(v):
+    """Returns `v` as a string, unless it is a string or None."""
+    return v if isinstance(v, str) or v is None else str(v)
+
+
 def edit_distance_fn(tuple1, tuple2, **kwargs):
     """A very simple edit distance similarity function.
 
@@ -73,14 +91,11 @@ def edit_distance_fn(tuple1, tuple2, **kwargs):
     tuple2 = tuple2 if isinstance(tuple2, tuple) else tuple([tuple2])
     assert (len(tuple1) == len(tuple2)), "tuples must be of same length"
 
-    def to_str(v):
-        return v if isinstance(v, str) or v is None else str(v)
-
     # compute tuple distances
     distances = []
     for i, value1 in enumerate(tuple1):
         value2 = tuple2[i]
-        value1, value2 = to_str(value1), to_str(value2)
+        value1, value2 = _to_str(value1), _to_str(value2)
         if value1 is value2 is None or value1 == value2 == '':
             # if both values are None or '', they are considered exact matches
             distances.append(0.0)
@@ -89,7 +104,7 @@ def edit_distance_fn(tuple1, tuple2, **kwargs):
             distances.append(1.0)
         else:
             # finally, compute and quasi-normalize the distance
-            distance = _nltk.edit_distance(value1, value2)
+            distance = _edit_distance(value1, value2)
             normal_distance = distance / (len(value1) + len(value2))
             distances.append(normal_distance)
 
@@ -101,6 +116,43 @@ def edit_distance_fn(tuple1, tuple2, **kwargs):
         return 1.0
 
 
+def _edit_distance_batch(value, values, **kwargs):
+    """Batched form of `edit_distance_fn`, which compares one value to each of many values.
+
+    The per-call setup of `edit_distance_fn` (i.e., checking the threshold and preparing the first value) is done once
+    for the batch, and pairs of single values are compared inline.
+
+    :param value: a tuple or a single value
+    :param values: a sequence of tuples or single values
+    :param kwargs: a context; e.g., may include threshold and algorithm-specific parameters
+    :return: list of measures in [0 1], one per value in `values`
+    """
+    if isinstance(value, tuple):
+        return [edit_distance_fn(value, value2, **kwargs) for value2 in values]
+
+    threshold = kwargs.get('threshold', 0.2)
+    assert 0.0 <= threshold <= 1.0, 'threshold not in [0.0, 1.0]'
+    value1 = _to_str(value)
+    distances = []
+    for value2 in values:
+        if isinstance(value2, tuple):
+            distances.append(edit_distance_fn(value, value2, **kwargs))
+            continue
+        value2 = _to_str(value2)
+        if value1 is value2 is None or value1 == value2 == '':
+            distances.append(0.0)
+        elif not value1 or not value2:
+            distances.append(1.0)
+        else:
+            distance = _edit_distance(value1, value2) / (len(value1) + len(value2))
+            distances.append(distance if distance <= threshold else 1.0)
+    return distances
+
+
+#: similarity functions may provide a `batch` form, which operators use to compare one value to many
+edit_distance_fn.batch = _edit_distance_batch
+
+
 def deprecated(f):
     """A simple 'deprecated' function decorator."""
     def wrapper(*args, **kwargs):
@@ -1,6 +1,7 @@
 """Methods for describing a catalog model."""
 
 from collections import defaultdict
+from operator import attrgetter
 
 
 def describe(obj):
@@ -19,6 +20,27 @@ def describe(obj):
     return TypeError('Objects of type {typ} are not supported'.format(typ=type(obj).__name__))
 
 
+class Description (object):
+    """Description of a catalog model object, for display as text or markdown.
+
+    The description is rendered on each display, so it reflects the current state of the model.
+    """
+    __slots__ = ('_make_markdown_repr',)
+
+    def __init__(self, make_markdown_repr):
+        """Initializes the description.
+
+        :param make_markdown_repr: function that renders the description, given a quote function
+        """
+        self._make_markdown_repr = make_markdown_repr
+
+    def _repr_markdown_(self):
+        return self._make_markdown_repr(quote=markdown_quote)
+
+    def __repr__(self):
+        return self._make_markdown_repr()
+
+
 def describe_catalog(model):
     """Returns a text (markdown) description.
 
@@ -27,23 +49,17 @@ def describe_catalog(model):
     """
 
     def _make_markdown_repr(quote=lambda s: s):
+        get_fields = attrgetter('name', 'comment')
         data = [
                    ["Name", "Comment"]
                ] + [
-                   [s.name, s.comment] for s in model.schemas.values()
+                   list(get_fields(s)) for s in model.schemas.values()
                ]
         desc = "### List of schemas\n" + \
                markdown_table(data, quote)
         return desc
 
-    class Description:
-        def _repr_markdown_(self):
-            return _make_markdown_repr(quote=markdown_quote)
-
-        def __repr__(self):
-            return _make_markdown_repr()
-
-    return Description()
+    return Description(_make_markdown_repr)
 
 
 def describe_schema(schema):
@@ -54,23 +70,18 @@ def describe_schema(schema):
     """
 
     def _make_markdown_repr(quote=lambda s: s):
+        schema_name = schema.name
+        get_fields = attrgetter('name', 'kind', 'comment')
         data = [
             ["Schema", "Name", "Kind", "Comment"]
         ] + [
-            [schema.name, t.name, t.kind, t.comment] for t in schema.tables.values()
+            [schema_name, *get_fields(t)] for t in schema.tables.values()
         ]
         desc = "### List of Tables\n" + \
                markdown_table(data, quote)
         return desc
 
-    class Description:
-        def _repr_markdown_(self):
-            return _make_markdown_repr(quote=markdown_quote)
-
-        def __repr__(self):
-            return _make_markdown_repr()
-
-    return Description()
+    return Description(_make_markdown_repr)
 
 
 def describe_table(table):
@@ -84,7 +95,7 @@ def describe_table(table):
         data = [
             ["Name", "Type", "Nullable", "Default", "Comment"]
         ] + [
-            [col.name, col.type.typename, str(col.nullok), col.default, col.comment] for col in table.columns
+            [col.name, col.type.typename, col.nullok, col.default, col.comment] for col in table.columns
         ]
         desc = "### Table \"" + quote(str(table.schema.name)) + ":" + quote(str(table.name)) + "\"\n" + \
                "#### Columns\n" + \
@@ -94,51 +105,52 @@ def describe_table(table):
             key_table = [
                 ["Constraint Name", "Unique Columns"]
             ] + [
-                [key.constraint_name, ", ".join(["%s" % c.name for c in key.unique_columns])] for key in table.keys
+                [key.constraint_name, ", ".join([c.name for c in key.unique_columns])] for key in table.keys
             ]
             desc += "#### Keys\n" + \
                     markdown_table(key_table, quote) + "\n"
 
-        if table.foreign_keys:
+        # the underlying foreign keys are described directly, rather than wrapping each of them, their columns and tables
+        wrapped_table = getattr(table, '_wrapped_obj', table)
+
+        if wrapped_table.foreign_keys:
             fkey_table = [
                 ["Constraint Name", "Foreign Key Columns", "Table", "Referenced Columns"]
             ] + [
                 [
                     fkey.constraint_name,
-                    ", ".join(["%s" % c.name for c in fkey.foreign_key_columns]),
-                    "%s:%s" % (fkey.pk_table.schema.name, fkey.pk_table.name),
-                    ", ".join(["%s" % c.name for c in fkey.referenced_columns])
+                    ", ".join([c.name for c in fkey.foreign_key_columns]),
+                    _qualified_name(fkey.pk_table),
+                    ", ".join([c.name for c in fkey.referenced_columns])
                 ]
-                for fkey in table.foreign_keys
+                for fkey in wrapped_table.foreign_keys
             ]
             desc += "#### Foreign Keys\n" + \
                     markdown_table(fkey_table, quote) + "\n"
 
-        if table.referenced_by:
+        if wrapped_table.referenced_by:
             refby_table = [
                 ["Constraint Name", "Table", "Foreign Key Columns", "Referenced Columns"]
             ] + [
                 [
                     fkey.constraint_name,
-                    "%s:%s" % (fkey.table.schema.name, fkey.table.name),
-                    ", ".join(["%s" % c.name for c in fkey.foreign_key_columns]),
-                    ", ".join(["%s" % c.name for c in fkey.referenced_columns])
+                    _qualified_name(fkey.table),
+                    ", ".join([c.name for c in fkey.foreign_key_columns]),
+                    ", ".join([c.name for c in fkey.referenced_columns])
                 ]
-                for fkey in table.referenced_by
+                for fkey in wrapped_table.referenced_by
             ]
             desc += "#### Referenced By\n" + \
                     markdown_table(refby_table, quote) + "\n"
 
         return desc
 
-    class Description:
-        def _repr_markdown_(self):
-            return _make_markdown_repr(quote=markdown_quote)
+    return Description(_make_markdown_repr)
 
-        def __repr__(self):
-            return _make_markdown_repr()
 
-    return Description()
+def _qualified_name(table):
+    """Returns the 'schema:table' name of a table."""
+    return f"{table.schema.name}:{table.name}"
 
 
 def markdown_quote(s, special="\\`*_{}[]()#+-.!"):
@@ -158,7 +170,7 @@ def markdown_table(data=[[""]], quote=lambda s: s):
     """Generates markdown table from input data."""
 
     # convert data into text
-    text = [list(map(lambda x: str(x), row)) for row in data]
+    text = [list(map(str, row)) for row in data]
 
     # determine the padding for each column
     padding = defaultdict(int)
@@ -3,6 +3,39 @@
 from graphviz import Digraph
 
 
+def _label(table):
+    """Returns the node label of a table."""
+    return f"{table.schema.name}.{table.name}"
+
+
+def _quote(name):
+    """Returns the quoted DOT identifier for a name."""
+    return '"' + name.replace('"', '\\"') + '"'
+
+
+def _node_lines(names):
+    """Returns the DOT statements for nodes, each labeled by its name."""
+    return [f'\t{quoted} [label={quoted}]\n' for quoted in map(_quote, names)]
+
+
+def _edge_lines(edges):
+    """Returns the DOT statements for (tail, head) edges."""
+    return [f'\t{_quote(tail_name)} -> {_quote(head_name)}\n' for tail_name, head_name in edges]
+
+
+def _unwrapped(obj):
+    """Returns the underlying model object of a wrapped model object, or else the object itself."""
+    return getattr(obj, '_wrapped_obj', obj)
+
+
+def _edges(label, table):
+    """Returns the outbound and then inbound (tail, head) edges of a table, given the table's label."""
+    # the underlying foreign keys are labeled directly, rather than wrapping each of them and their tables
+    table = _unwrapped(table)
+    return [(label, _label(fkey.pk_table)) for fkey in table.foreign_keys] + \
+           [(_label(reference.table), label) for reference in table.referenced_by]
+
+
 def graph(obj, engine='fdp'):
     """Generates and returns a graphviz Digraph.
 
@@ -30,21 +63,20 @@ def graph_model(model, engine='fdp'):
     dot = Digraph(name='Catalog Model', engine=engine, node_attr={'shape': 'box'})
     dot.attr('graph', overlap='false', splines='true')
 
-    # add nodes
+    # add nodes, collecting the edges to be added after all of the nodes
+    edges = []
     for schema in model.schemas.values():
-        with dot.subgraph(name=schema.name, node_attr={'shape': 'box'}) as subgraph:
-            for table in schema.tables.values():
-                label = "%s.%s" % (schema.name, table.name)
-                subgraph.node(label, label)
+        schema_name = schema.name
+        labels = []
+        for table in schema.tables.values():
+            label = f"{schema_name}.{table.name}"
+            labels.append(label)
+            edges.extend((label, fkey.pk_table) for fkey in _unwrapped(table).foreign_keys)
+        with dot.subgraph(name=schema_name, node_attr={'shape': 'box'}) as subgraph:
+            subgraph.body.extend(_node_lines(labels))
 
     # add edges
-    for schema in model.schemas.values():
-        for table in schema.tables.values():
-            tail_name = "%s.%s" % (schema.name, table.name)
-            for fkey in table.foreign_keys:
-                refcol = fkey.referenced_columns[0]
-                head_name = "%s.%s" % (refcol.table.schema.name, refcol.table.name)
-                dot.edge(tail_name, head_name)
+    dot.body.extend(_edge_lines((tail_name, _label(pk_table)) for tail_name, pk_table in edges))
 
     return dot
 
@@ -59,45 +91,18 @@ def graph_schema(schema, engine='fdp'):
     dot = Digraph(name=schema.name, engine=engine, node_attr={'shape': 'box'})
     dot.attr('graph', overlap='false', splines='true')
 
-    # add nodes
-    for table in schema.tables.values():
-        label = "%s.%s" % (schema.name, table.name)
-        dot.node(label, label)
+    # label the nodes
+    schema_name = schema.name
+    labeled_tables = [(f"{schema_name}.{table.name}", table) for table in schema.tables.values()]
+    own_names = {label for label, _ in labeled_tables}
 
-    # track referenced nodes
-    seen = set()
+    # collect the distinct edges, in order
+    edges = dict.fromkeys(edge for label, table in labeled_tables for edge in _edges(label, table))
 
-    # add edges
-    for table in schema.tables.values():
-        # add outbound edges
-        tail_name = "%s.%s" % (schema.name, table.name)
-        for fkey in table.foreign_keys:
-            refcol = fkey.referenced_columns[0]
-            head_name = "%s.%s" % (refcol.table.schema.name, refcol.table.name)
-            # add head node, if not seen
-            if head_name not in seen:
-                seen.add(head_name)
-                dot.node(head_name, head_name)
-            # add edge, if not seen before
-            edge = (tail_name, head_name)
-            if edge not in seen:
-                seen.add(edge)
-                dot.edge(tail_name, head_name)
-
-        # add inbound edges
-        head_name = tail_name
-        for reference in table.referenced_by:
-            fkeycol = reference.foreign_key_columns[0]
-            tail_name = "%s.%s" % (fkeycol.table.schema.name, fkeycol.table.name)
-            # add tail node, if not seen
-            if tail_name not in seen:
-                seen.add(tail_name)
-                dot.node(tail_name, tail_name)
-            # add head node, if not seen
-            edge = (tail_name, head_name)
-            if edge not in seen:
-                seen.add(edge)
-                dot.edge(tail_name, head_name)
+    # add the nodes, then the referenced nodes of other schemas, then the edges
+    dot.body.extend(_node_lines(label for label, _ in labeled_tables))
+    dot.body.extend(_node_lines(dict.fromkeys(name for edge in edges for name in edge if name not in own_names)))
+    dot.body.extend(_edge_lines(edges))
 
     return dot
 
@@ -112,32 +117,13 @@ def graph_table(table, engine='fdp'):
     dot = Digraph(name=table.name, engine=engine, node_attr={'shape': 'box'})
     dot.attr('graph', overlap='false', splines='true')
 
-    # add node
-    label = "%s.%s" % (table.schema.name, table.name)
-    dot.node(label, label)
+    # collect outbound and inbound edges
+    label = _label(table)
+    edges = _edges(label, table)
 
-    # track referenced nodes
-    seen = set()
-
-    # add edges
-    # add outbound edges
-    tail_name = "%s.%s" % (table.schema.name, table.name)
-    for fkey in table.foreign_keys:
-        refcol = fkey.referenced_columns[0]
-        head_name = "%s.%s" % (refcol.table.schema.name, refcol.table.name)
-        if head_name not in seen:
-            dot.node(head_name, head_name)
-            seen.add(head_name)
-        dot.edge(tail_name, head_name)
-
-    # add inbound edges
-    head_name = tail_name
-    for reference in table.referenced_by:
-        fkeycol = reference.foreign_key_columns[0]
-        tail_name = "%s.%s" % (fkeycol.table.schema.name, fkeycol.table.name)
-        if tail_name not in seen:
-            dot.node(tail_name, tail_name)
-            seen.add(tail_name)
-        dot.edge(tail_name, head_name)
+    # add the node, then the referenced nodes, then the edges
+    dot.body.extend(_node_lines([label]))
+    dot.body.extend(_node_lines(dict.fromkeys(name for edge in edges for name in edge if name != label)))
+    dot.body.extend(_edge_lines(edges))
 
     return dot
@@ -41,6 +41,11 @@ setup(
         'pyparsing',
         'rdflib'
     ],
+    extras_require={
+        'orjson': ['orjson'],
+        'pyarrow': ['pyarrow'],
+        'rapidfuzz': ['rapidfuzz']
+    },
     license='Apache 2.0',
     classifiers=[
         'Intended Audience :: Science/Research',
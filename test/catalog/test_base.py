@@ -18,6 +18,56 @@ class TestBaseCatalog (BaseTestCase):
             val = 'bar'
         self.assertEqual(val, 'foo', "catalog model evolve session did not exit on rollback")
 
+    def test_tables_contains(self):
+        tables = self.model.schemas['.'].tables
+        self.assertIn(self.catalog_helper.samples, tables)
+        self.assertNotIn(self.output_basename, tables)
+        self.assertIn(self.catalog_helper.samples, tables.keys())
+        self.assertEqual(len(tables), len(tables._mapping))
+        self.assertEqual(len(tables), len(list(tables)))
+
+    def test_columns_contains(self):
+        columns = self.model.schemas['.'].tables[self.catalog_helper.samples].columns
+        self.assertIn(columns[0].name, columns)
+        self.assertIn(columns[0], columns)
+        self.assertNotIn('no_such_column', columns)
+
+    def test_table_lookup(self):
+        self.assertEqual(self.model._tables, {})
+        table = self.model._table('.', self.catalog_helper.samples)
+        self.assertEqual(len(self.model._tables), 1)
+        self.assertEqual(table, self.model.schemas['.'].tables[self.catalog_helper.samples])
+        self.assertIs(table, self.model._table('.', self.catalog_helper.samples))
+        self.assertIs(table, self.model._wrap_table(table._wrapped_obj))
+
+    def test_wrapped_attributes_patched_on_access(self):
+        table = self.model.schemas['.'].tables[self.catalog_helper.samples]
+        self.assertNotIn('annotations', vars(table))
+        self.assertIs(table.annotations, table._wrapped_obj.annotations)
+        self.assertIn('annotations', vars(table))
+        self.assertFalse(hasattr(table, 'no_such_attribute'))
+
+    def test_computed_relation_model(self):
+        samples = self.model.schemas['.'].tables[self.catalog_helper.samples]
+        relation = samples.select(samples.columns[0])
+        self.assertIn(relation.name, relation.schema.tables)
+        self.assertEqual(set(relation.schema.model.schemas), set(self.model.schemas))
+        self.assertEqual(relation.schema.tables[samples.name].name, samples.name)
+
+    def test_columns_iter(self):
+        columns = self.model.schemas['.'].tables[self.catalog_helper.samples].columns
+        self.assertEqual([column.name for column in columns], [columns[i].name for i in range(len(columns))])
+
+    def test_tables_items(self):
+        tables = self.model.schemas['.'].tables
+        self.assertEqual([name for name, _ in tables.items()], list(tables))
+        self.assertEqual([table.name for table in tables.values()], list(tables))
+        self.assertEqual(len(tables.values()), len(tables))
+
+    def test_tables_key_completions(self):
+        tables = self.model.schemas['.'].tables
+        self.assertEqual(list(tables._ipython_key_completions_()), list(tables))
+
     def test_catalog_describe(self):
         _util.describe(self.model)
 
@@ -27,6 +77,15 @@ class TestBaseCatalog (BaseTestCase):
     def test_table_describe(self):
         _util.describe(self.model.schemas['.'].tables[self.catalog_helper.samples])
 
+    def test_describe_rendered_on_display(self):
+        table = self.model.schemas['.'].tables[self.catalog_helper.samples]
+        description = _util.describe(table)
+        self.assertIn(self.catalog_helper.samples, repr(description))
+        self.assertNotIn('revised comment', description._repr_markdown_())
+        table.columns['species'].comment = 'revised comment'
+        self.assertIn('revised comment', repr(description))
+        self.assertIn('revised comment', description._repr_markdown_())
+
     def test_catalog_graph(self):
         _util.graph(self.model)
 
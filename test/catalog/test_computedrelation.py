@@ -1,7 +1,11 @@
 """A few direct tests on computed relatoin expressions.
 """
+import importlib.util
+import sys
 import unittest
+from unittest import mock
 from deriva.chisel.catalog.semistructured import json_reader
+from deriva.chisel.optimizer import symbols
 
 payload = [
     {
@@ -32,18 +36,147 @@ class TestComputedRelation (unittest.TestCase):
     def tearDown(self):
         self._rel = None
 
+    def test_lazy_export(self):
+        import deriva.chisel
+        self.assertIs(deriva.chisel.json_reader, json_reader)
+        with self.assertRaises(AttributeError):
+            getattr(deriva.chisel, 'no_such_reader')
+
+    def test_optimized_plan_memoized(self):
+        optimized = self._rel._optimized_logical_plan()
+        self.assertIs(optimized, self._rel._optimized_logical_plan())
+        self._rel.logical_plan = optimized
+        self.assertIs(self._rel._optimized_logical_plan(), optimized)
+        self.assertEqual(list(self._rel.fetch()), payload)
+
+    def test_deferred_binding(self):
+        self.assertIsNotNone(self._rel.__dict__.get('_unbound_parent'))
+        self.assertEqual(list(self._rel.fetch()), payload)
+        self.assertIsNotNone(self._rel.__dict__.get('_unbound_parent'))
+        self.assertEqual(len(self._rel.columns), len(payload[0].keys()))
+        self.assertIsNone(self._rel.__dict__.get('_unbound_parent'))
+        with self.assertRaises(AttributeError):
+            getattr(self._rel, 'no_such_attribute')
+
+    def test_union_validated(self):
+        other = json_reader(object_payload=[{'RID': 1, 'property_4': 'xyz'}])
+        with self.assertRaises(ValueError):
+            self._rel.union(other)
+        self.assertEqual(len(self._rel.union(self._rel).columns), len(payload[0].keys()))
+
+    def test_failed_binding_repeated(self):
+        # an expression that fails to plan raises the planning error on each access, not only the first
+        malformed = self._rel.select(symbols.AttributeAdd('{'))
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                malformed.columns
+        self.assertIsNotNone(malformed.__dict__.get('_unbound_parent'))
+
+    def test_bound_plan_fetched_once(self):
+        self.assertEqual(len(self._rel.columns), len(payload[0].keys()))
+        plan = self._rel._unfetched[1]
+        self.assertIs(self._rel.fetch(), plan)
+        self.assertIsNot(self._rel.fetch(), plan)
+        self.assertEqual(list(plan), payload)
+        self.assertEqual(list(self._rel.fetch()), payload)
+
+    def test_composition_defers_binding(self):
+        selected = self._rel.where(self._rel.columns['property_2'] > 1000)
+        projected = selected.select('RID', 'property_2')
+        self.assertIsNotNone(selected.__dict__.get('_unbound_parent'))
+        self.assertIs(projected.__dict__.get('_unbound_parent'), selected.__dict__.get('_unbound_parent'))
+        self.assertEqual(list(projected.fetch()), [{'RID': row['RID'], 'property_2': row['property_2']} for row in payload])
+        self.assertEqual(len(projected.columns), 2)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow not installed')
+    def test_fetch_arrow(self):
+        table = self._rel.fetch_arrow()
+        self.assertEqual(table.column_names, [c.name for c in self._rel.columns])
+        self.assertEqual(table.to_pylist(), [{name: row.get(name) for name in table.column_names} for row in payload])
+
+    def test_fetch_arrow_unavailable(self):
+        with mock.patch.dict(sys.modules, {'pyarrow': None}):
+            with self.assertRaises(ImportError):
+                self._rel.fetch_arrow()
+
     def test_description(self):
         self.assertIsNotNone(self._rel.columns)
         self.assertEqual(len(self._rel.columns), len(payload[0].keys()))
 
+    def test_select_drop(self):
+        dropped = self._rel.select(self._rel.columns['property_3'].inv())
+        self.assertEqual(len(dropped.columns), len(payload[0].keys()) - 1)
+        self.assertNotIn('property_3', dropped.columns)
+
+    def test_select_drops_fused(self):
+        from deriva.chisel.optimizer import logical_planner, Project
+        dropped = self._rel.select(~self._rel.columns['property_2']).select(~self._rel.columns['property_3'])
+        plan = logical_planner(dropped.logical_plan)
+        self.assertIsInstance(plan, Project)
+        self.assertNotIsInstance(plan.child, Project)
+        self.assertEqual(list(dropped.fetch()), [{'RID': row['RID'], 'property_1': row['property_1']} for row in payload])
+
+    def test_where_chained(self):
+        selected = self._rel
+        for threshold in range(0, 2000, 100):
+            selected = selected.where(selected.columns['property_2'] > threshold)
+        self.assertEqual(len(selected.columns), len(payload[0].keys()))
+        self.assertEqual(list(selected.fetch()), payload[1:])
+
+    def test_where_fused(self):
+        from deriva.chisel.optimizer import Select, Conjunction
+        property_2 = self._rel.columns['property_2']
+        selected = self._rel.where(property_2 > 1000).where(property_2 < 6000)
+        self.assertIsInstance(selected.logical_plan.formula, Conjunction)
+        self.assertNotIsInstance(selected.logical_plan.child, Select)
+        self.assertEqual(list(selected.fetch()), payload)
+        selected = selected.where((property_2 < 2000) | (property_2 > 5000))
+        self.assertIsInstance(selected.logical_plan.child, Select)
+        self.assertEqual(list(selected.fetch()), payload)
+
+    def test_select_mixed_mutations(self):
+        with self.assertRaises(ValueError):
+            self._rel.select(self._rel.columns['property_3'].inv(), 'property_1')
+        with self.assertRaises(ValueError):
+            self._rel.select(self._rel.columns['property_3'].inv(), symbols.AttributeAdd({'name': 'property_4', 'type': {'typename': 'text'}}))
+
+    def test_clauses_interned(self):
+        column = self._rel.columns['property_2']
+        self.assertIs(column == 1234, column == 1234)
+        self.assertIsNot(column == 1, column == True)
+        self.assertEqual((column == [1]).operand2, [1])
+        self.assertIs(type((column == (True,)).operand2[0]), bool)
+        self.assertIs(type((column == (1,)).operand2[0]), int)
+        self.assertIs(column.alias('foo'), column.alias('foo'))
+        self.assertIs(~column, ~column)
+
+    def test_where_isin(self):
+        selected = self._rel.where(self._rel.columns['RID'].isin([2, 3]))
+        self.assertEqual(list(selected.fetch()), payload[1:])
+        with self.assertRaises(ValueError):
+            self._rel.columns['RID'].isin([])
+
     def test_reifySub(self):
         parted = self._rel.reify_sub(self._rel.columns['property_2'])
         self.assertEqual(len(parted.columns), 2)
 
+    def test_reify_disjoint(self):
+        reified = self._rel.reify([self._rel.columns['property_1']], 'property_2')
+        self.assertEqual({c.name for c in reified.columns}, {'property_1', 'property_2'})
+        with self.assertRaises(ValueError):
+            self._rel.reify(['property_1'], self._rel.columns['property_1'])
+
     def test_atomize(self):
         atomized = self._rel.columns['property_3'].to_atoms()
         self.assertEqual(len(atomized.columns), 2)
 
+    def test_atomize_domainify(self):
+        from deriva.chisel.optimizer import logical_planner, AddForeignKey
+        atoms = self._rel.columns['property_3'].to_atoms()
+        domain = atoms.columns['property_3'].to_domain()
+        self.assertNotIn(AddForeignKey.__name__, str(logical_planner(domain.logical_plan)))
+        self.assertEqual(sorted(row['name'].lower() for row in domain.fetch()), ['cat', 'dog', 'mouse'])
+
     def test_tagify(self):
         tagged = self._rel.columns['property_3'].to_tags(json_reader(object_payload=domain))
         self.assertEqual(len(tagged.columns), 2)
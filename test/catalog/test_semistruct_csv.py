@@ -14,6 +14,10 @@ class TestSemistructuredCsv (BaseTestCase):
         self.assertIsNotNone(self.model)
         self.assertEqual(len(self.model.schemas), 1)
 
+    def test_extant_symbol_cached(self):
+        symbol = self.model.make_extant_symbol('.', self.catalog_helper.samples)
+        self.assertIs(symbol, self.model.make_extant_symbol('.', self.catalog_helper.samples))
+
     def test_computed_relation_from_csv(self):
         domain = self.model.schemas['.'].tables[self.catalog_helper.samples].columns['species'].to_domain()
         self.assertIsNotNone(domain)
@@ -24,6 +28,17 @@ class TestSemistructuredCsv (BaseTestCase):
         self.model.schemas['.'].create_table_as(self.output_basename, domain)
         self.assertTrue(self.catalog_helper.exists(self.output_basename))
 
+    def test_plan_memo_cleared_on_commit(self):
+        from deriva.chisel.catalog.ext import _plan_memo
+        samples = self.model.schemas['.'].tables[self.catalog_helper.samples]
+        domain = samples.columns['species'].to_domain(similarity_fn=None)
+        self.assertTrue(len(domain.columns))
+        memo = _plan_memo(self.model)
+        self.assertIs(memo, _plan_memo(domain.schema.model))
+        self.assertTrue(len(memo))
+        self.model.schemas['.'].create_table_as(self.output_basename, domain)
+        self.assertEqual(len(memo), 0)
+
     def test_clone(self):
         self.model.schemas['.'].create_table_as(
             self.output_basename, self.model.schemas['.'].tables[self.catalog_helper.samples].clone())
@@ -1,5 +1,7 @@
 """Unit tests against an on disk JSON data source.
 """
+import json
+from deriva.chisel.catalog import semistructured
 from test.helpers import CatalogHelper, BaseTestCase
 
 
@@ -28,3 +30,17 @@ class TestSemistructuredJson (BaseTestCase):
         samples = self.model.schemas['.'].tables[self.catalog_helper.samples]
         with self.assertRaises(ValueError):
             self.model.schemas['.'].create_table_as(self.catalog_helper.samples, samples.clone())
+
+    def test_encode_json(self):
+        # the optional encoder, if installed, must produce the text of the standard encoder
+        for rows in (
+                [{'RID': 1, 'name': 'plain', 'value': 1.5}],
+                [{'RID': 1, 'name': 'caf\u00e9 \u2013 \u732b'}],
+                [{'RID': 1, 'name': 'delete \x7f'}],
+                [{'RID': 1, 'value': float('nan')}, {'RID': 2, 'value': [float('inf'), -float('inf')]}],
+                [{'RID': 1, 'value': 1e16}, {'RID': 2, 'value': 1e-7}, {'RID': 3, 'value': 1.2345678901234568e17},
+                 {'RID': 4, 'value': 1e-05}, {'RID': 5, 'value': 123.456}]):
+            text = semistructured._encode_json(rows)
+            self.assertEqual(text, semistructured._json_encoder.encode(rows))
+            self.assertTrue(text.isascii())
+            self.assertEqual(json.dumps(json.loads(text)), json.dumps(rows))
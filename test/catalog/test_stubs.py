@@ -0,0 +1,39 @@
+"""Unit tests for the catalog model stubs.
+"""
+import unittest
+from deriva.chisel.catalog.stubs import ModelStub
+
+
+class TestModelStub (unittest.TestCase):
+    """Tests for the model stub."""
+    def setUp(self):
+        self._model = ModelStub({
+            'schemas': {
+                's': {
+                    'tables': {
+                        't': {},
+                        'u': {
+                            'foreign_keys': [
+                                {
+                                    'names': [['s', 'u_fkey']],
+                                    'referenced_columns': [{'schema_name': 's', 'table_name': 't', 'column_name': 'id'}]
+                                },
+                                {
+                                    'names': [['s', 'u_other_fkey']],
+                                    'referenced_columns': [{'schema_name': 'x', 'table_name': 'y', 'column_name': 'id'}]
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        })
+
+    def test_fkey_pk_table(self):
+        fkey = self._model.fkey(['s', 'u_fkey'])
+        self.assertIs(fkey.table, self._model.schemas['s'].tables['u'])
+        self.assertIs(fkey.pk_table, self._model.schemas['s'].tables['t'])
+
+    def test_fkey_unknown_pk_table(self):
+        self.assertIs(self._model.fkey(['s', 'u_other_fkey']).pk_table, self._model._unknown_table)
+        self.assertIs(self._model.fkey(['s', 'missing']).pk_table, self._model._unknown_table)
@@ -0,0 +1,37 @@
+"""Tests for the BufferedOperator operator."""
+import itertools
+import unittest
+import deriva.chisel.operators as _op
+
+payload = [
+    {
+        'RID': 1,
+        'property_1': 'hello'
+    },
+    {
+        'RID': 2,
+        'property_1': 'world'
+    }
+]
+
+
+class TestBufferedOperator (unittest.TestCase):
+
+    def test_buffered_rows(self):
+        buffered = _op.BufferedOperator(_op.JSONScan(object_payload=payload))
+        self.assertEqual(list(buffered), payload)
+        self.assertEqual(list(buffered), payload, 'expected the buffered rows on repeated iteration')
+
+    def test_abandoned_iteration(self):
+        buffered = _op.BufferedOperator(_op.JSONScan(object_payload=payload))
+        self.assertEqual(list(itertools.islice(buffered, 1)), payload[:1])
+        self.assertEqual(list(buffered), payload, 'expected all rows after an abandoned iteration')
+
+    def test_empty_child(self):
+        buffered = _op.BufferedOperator(_op.JSONScan(json_content='[]'))
+        self.assertEqual(list(buffered), [])
+        self.assertTrue(buffered._buffered, 'expected an empty child to be marked as buffered')
+
+
+if __name__ == '__main__':
+    unittest.main()
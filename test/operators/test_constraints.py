@@ -0,0 +1,42 @@
+"""Tests for the integrity constraint modification operators."""
+import unittest
+import deriva.chisel.operators as _op
+import deriva.chisel.optimizer as _opt
+
+payload = [
+    {
+        'id': 1,
+        'name': 'hello'
+    },
+    {
+        'id': 2,
+        'name': 'world'
+    }
+]
+
+
+class TestConstraints (unittest.TestCase):
+    """Basic tests for the constraint operators."""
+    def setUp(self):
+        self._child = _op.JSONScan(object_payload=payload)
+
+    def tearDown(self):
+        self._child = None
+
+    def test_add_key_leaves_child_description(self):
+        num_keys = len(self._child.description['keys'])
+        oper = _op.AddKey(self._child, ['name'])
+        self.assertEqual(len(oper.description['keys']), num_keys + 1)
+        self.assertEqual(len(self._child.description['keys']), num_keys)
+        self.assertIs(oper.description['column_definitions'], self._child.description['column_definitions'])
+
+    def test_drop_constraints_leaves_child_description(self):
+        num_keys = len(self._child.description['keys'])
+        self.assertGreater(num_keys, 0)
+        oper = _op.DropConstraint(self._child, _opt.AllConstraints, _op.DropConstraint.KEYS)
+        self.assertEqual(oper.description['keys'], [])
+        self.assertEqual(len(self._child.description['keys']), num_keys)
+
+
+if __name__ == '__main__':
+    unittest.main()
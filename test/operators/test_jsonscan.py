@@ -36,6 +36,15 @@ class TestJSONScan (unittest.TestCase):
             self.assertIn('property_1', row, 'could not find property_1 in row')
         self.assertEqual(count_rows, len(payload), 'could not iterate all rows')
 
+    def test_invalid_payload(self):
+        with self.assertRaises(ValueError):
+            _op.JSONScan(json_content='{"RID": 1}')
+        with self.assertRaises(ValueError):
+            _op.JSONScan(json_content='[1, 2, 3]')
+
+    def test_empty_array(self):
+        self.assertEqual(list(_op.JSONScan(json_content='[]')), [])
+
 
 if __name__ == '__main__':
     unittest.main()
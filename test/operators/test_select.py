@@ -57,6 +57,30 @@ class TestSelect (unittest.TestCase):
         self.assertDictEqual(self._child.description, oper.description, "table definition should match source")
         self.assertEqual(self._test_helper.num_test_rows-1, count(oper), 'incorrect number of rows returned by operator')
 
+    def test_select_disjunction_eq(self):
+        comparisons = [
+            _opt.Comparison(self._test_helper.FIELDS[0], 'eq', 0),
+            _opt.Comparison(self._test_helper.FIELDS[0], 'eq', 1),
+            _opt.Comparison(self._test_helper.FIELDS[0], 'eq', -1)
+            ]
+        comparison = _opt.Disjunction(comparisons)
+        oper = _op.Select(self._child, comparison)
+        self.assertDictEqual(self._child.description, oper.description, "table definition should match source")
+        self.assertEqual(2, count(oper), 'incorrect number of rows returned by operator')
+
+    def test_select_disjunction_eq_mixed_types(self):
+        child = _op.JSONScan(object_payload=[
+            {'id': 1, 'value': 1}, {'id': 2, 'value': '1'}, {'id': 3, 'value': True},
+            {'id': 4, 'value': 1.0}, {'id': 5, 'value': None}, {'id': 6, 'value': 2}
+        ])
+        for operands in ([1, 2], [1, 1.0], [True, 2], ['1', 2], ['1', '2'], [None, '1']):
+            comparison = _opt.Disjunction(tuple(_opt.Comparison('value', 'eq', operand) for operand in operands))
+            oper = _op.Select(child, comparison)
+            self.assertEqual(
+                [row['id'] for row in child if oper._eval_formula(row)], [row['id'] for row in oper],
+                'membership test differs from the formula for operands %s' % operands
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
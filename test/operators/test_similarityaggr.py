@@ -77,6 +77,11 @@ class TestSimilarityAggregation (unittest.TestCase):
         logger.debug(sa.description)
         self.assertEqual(len(tuples), 2, "expected 2 groups/tuples")
 
+    def test_grouping_wo_batch_similarity(self):
+        child = _op.JSONScan(object_payload=self.data)
+        sa = _op.NestedLoopsSimilarityAggregation(child, ('name',), tuple(), lambda v1, v2: _util.edit_distance_fn(v1, v2), None)
+        self.assertEqual(len(list(sa)), 2, "expected 2 groups/tuples")
+
     def test_grouping_and_nesting_single_attrs(self):
         for datum in self.data:  # extend raw data with synonyms
             datum['synonyms'] = datum['name']
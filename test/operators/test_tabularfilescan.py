@@ -0,0 +1,39 @@
+"""Tests for the TabularFileScan operator."""
+import os
+import tempfile
+import unittest
+import deriva.chisel.operators as _op
+
+
+class TestTabularFileScan (unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._dir.name, 'scan.csv')
+        with open(self._filename, 'w') as f:
+            f.write('id,name\n1,hello\n2,world\n')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_can_iterate_rows(self):
+        rows = list(_op.TabularFileScan(self._filename))
+        self.assertEqual(rows, [{'id': '1', 'name': 'hello'}, {'id': '2', 'name': 'world'}])
+
+    def test_names_shared(self):
+        scan = _op.TabularFileScan(self._filename)
+        row = next(iter(scan))
+        for name, col in zip(row, scan.description['column_definitions']):
+            self.assertIs(name, col['name'])
+
+    def test_cached_schema_distinguishes_introspection(self):
+        shallow = _op.TabularFileScan(self._filename)
+        deep = _op.TabularFileScan(self._filename, deep_introspection=True)
+        types = {col['name']: col['type']['typename'] for col in shallow.description['column_definitions']}
+        self.assertEqual(types['id'], 'text')
+        types = {col['name']: col['type']['typename'] for col in deep.description['column_definitions']}
+        self.assertEqual(types['id'], 'int4', 'expected deep introspection to determine the column type')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 """Tests with and without enabling work sharing consolidation.
 """
+from unittest import mock
+from deriva.chisel.operators import TabularFileScan
+from deriva.chisel.optimizer import consolidate
 from test.helpers import CatalogHelper, BaseTestCase
 
 
@@ -30,3 +33,27 @@ class TestConsolidate (BaseTestCase):
 
         self.assertTrue(self.catalog_helper.exists(self._test_output_consolidate_anatomy))
         self.assertTrue(self.catalog_helper.exists(self._test_output_consolidate_gene))
+
+    def test_consolidate_single_relation(self):
+        samples = self.model.schemas['.'].tables[self.catalog_helper.samples]
+        mice = samples.where(samples.columns['species'] == 'Mus musculus')
+        scans, tempvars = [], []
+        scan = TabularFileScan.__iter__
+
+        def counted_scan(operator):
+            scans.append(operator)
+            yield from scan(operator)
+
+        def recorded_consolidate(computed_relations):
+            tempvars.extend(consolidate(computed_relations))
+            return tempvars
+
+        with mock.patch.object(TabularFileScan, '__iter__', counted_scan), \
+                mock.patch('deriva.chisel.catalog.ext.consolidate', recorded_consolidate):
+            with self.model.begin(enable_work_sharing=True) as sess:
+                sess.create_table_as('.', self._test_output_consolidate_gene, mice.union(mice))
+
+        self.assertEqual(len(scans), 1, 'shared sub-expression was not computed once')
+        self.assertTrue(tempvars, 'shared sub-expression was not consolidated')
+        self.assertTrue(all(tempvar._materialized is None for tempvar in tempvars), 'temp var rows outlived the commit')
+        self.assertTrue(self.catalog_helper.exists(self._test_output_consolidate_gene))
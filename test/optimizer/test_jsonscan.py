@@ -1,5 +1,6 @@
 """Unit tests for the JSONDataExtant operator.
 """
+import json
 import unittest
 import deriva.chisel.optimizer as _opt
 
@@ -26,6 +27,59 @@ class TestJSONScan (unittest.TestCase):
     def test_logical_planner(self):
         self.assertIsNotNone(_opt.logical_planner(self._plan))
 
+    def test_logical_planner_memoized(self):
+        plan = _opt.Distinct(
+            _opt.JSONDataExtant(input_filename=None, json_content=json.dumps(payload), object_payload=None, key_regex=None),
+            ('RID',)
+        )
+        memo = _opt.PlanMemo()
+        self.assertIs(_opt.logical_planner(plan, memo), _opt.logical_planner(plan, memo))
+        # equal tuples of different symbol types must not share a memoized plan
+        self.assertIsInstance(_opt.logical_planner(_opt.Project(*plan), memo), _opt.Project)
+        self.assertIs(memo.key(plan), memo.key(plan))
+        self.assertNotEqual(memo.key(plan), memo.key(_opt.Project(*plan)))
+        # rewritten plans are their own rewritten plans
+        rewritten = _opt.logical_planner(plan, memo)
+        self.assertIs(memo._plans[memo.key(rewritten)], rewritten)
+        # clearing the memo releases the plans and symbols
+        memo.clear()
+        self.assertEqual(len(memo), 0)
+        self.assertEqual(len(memo._keys), 0)
+
+    def test_unchanged_plan_preserved(self):
+        from deriva.chisel.optimizer import rules
+        plan = _opt.Project(self._plan, ('RID',))
+        self.assertIs(_opt._execute_rules(rules.logical_optimization_rules, plan), plan)
+
+    def test_rename_fused(self):
+        renames = (_opt.AttributeAlias('property_1', 'greeting'),)
+        plan = _opt.logical_planner(_opt.Rename(_opt.Project(self._plan, ('RID', 'property_1')), renames))
+        self.assertIsInstance(plan, _opt.Project)
+        self.assertEqual(plan.attributes, ('RID',) + renames)
+        self.assertEqual([row['greeting'] for row in _opt.physical_planner(plan)], ['hello', 'world'])
+
+    def test_renames_composed(self):
+        inner = (_opt.AttributeAlias('property_1', 'greeting'),)
+        outer = (_opt.AttributeAlias('greeting', 'salutation'), _opt.AttributeAlias('RID', 'id'))
+        plan = _opt.logical_planner(_opt.Rename(_opt.Rename(self._plan, inner), outer))
+        self.assertIsInstance(plan, _opt.Rename)
+        self.assertIs(plan.child, self._plan)
+        self.assertEqual(plan.renames, (_opt.AttributeAlias('property_1', 'salutation'), _opt.AttributeAlias('RID', 'id')))
+        self.assertEqual([row['salutation'] for row in _opt.physical_planner(plan)], ['hello', 'world'])
+
+    def test_renames_composed_renamed_away(self):
+        # an outer rename of an attribute that the inner rename has renamed away renames nothing
+        inner = (_opt.AttributeAlias('property_1', 'greeting'),)
+        outer = (_opt.AttributeAlias('property_1', 'salutation'),)
+        unfused = _opt.physical_planner(_opt.Rename(_opt.physical_planner(_opt.Rename(self._plan, inner)), outer))
+        plan = _opt.logical_planner(_opt.Rename(_opt.Rename(self._plan, inner), outer))
+        self.assertEqual(plan.renames, inner)
+        self.assertEqual(list(_opt.physical_planner(plan)), list(unfused))
+        self.assertEqual(
+            {c['name'] for c in _opt.physical_planner(plan).description['column_definitions']},
+            {c['name'] for c in unfused.description['column_definitions']}
+        )
+
     def test_physical_planner(self):
         lp = _opt.logical_planner(self._plan)
         self.assertIsNotNone(_opt.physical_planner(lp))
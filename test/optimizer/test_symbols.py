@@ -0,0 +1,30 @@
+"""Unit tests for the logical symbols.
+"""
+import unittest
+import deriva.chisel.optimizer as _opt
+
+
+class TestFormulas (unittest.TestCase):
+    """Tests for the formula symbols."""
+    def setUp(self):
+        self._a = _opt.Comparison('x', 'gt', 1)
+        self._b = _opt.Comparison('y', 'eq', 'foo')
+        self._c = _opt.Comparison('x', 'lt', 5)
+
+    def test_conjunction_canonical(self):
+        self.assertEqual(self._a & self._b, self._b & self._a)
+        self.assertEqual((self._a & self._b) & self._c, self._c & (self._b & self._a))
+        self.assertEqual(len((self._a & self._b & self._a).comparisons), 2)
+
+    def test_disjunction_canonical(self):
+        self.assertEqual(self._a | self._b, self._b | self._a)
+        self.assertEqual(len((self._a | self._a).comparisons), 1)
+
+    def test_all_attributes_shared(self):
+        import copy
+        self.assertIs(_opt.AllAttributes(), _opt.AllAttributes())
+        self.assertIs(copy.deepcopy(_opt.AllAttributes()), _opt.AllAttributes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,3 +63,11 @@ class TestEditDistance (unittest.TestCase):
         ]
         for s1, s2, dist in tests:
             self.assertEqual(util.edit_distance_fn(s1, s2, threshold=1.0), dist)
+
+    def test_batch(self):
+        values = ['heart', 'Heart', 'hart', 'bar', '', None, ('heart',)]
+        for value in ['heart', '', None, ('heart',)]:
+            self.assertEqual(
+                util.edit_distance_fn.batch(value, values, threshold=0.2),
+                [util.edit_distance_fn(value, value2, threshold=0.2) for value2 in values]
+            )
@@ -0,0 +1,15 @@
+import unittest
+from deriva.chisel import util
+
+
+class TestSplitter (unittest.TestCase):
+    def test_split_and_strip(self):
+        splitter = util.splitter_fn(',')
+        self.assertEqual(splitter('cat, dog ,mouse'), ['cat', 'dog', 'mouse'])
+        self.assertEqual(splitter(''), [])
+        self.assertEqual(splitter(None), [])
+        self.assertEqual(splitter(' cat '), ['cat'])
+
+    def test_same_splitter_per_delim(self):
+        self.assertIs(util.splitter_fn(';'), util.splitter_fn(';'))
+        self.assertIsNot(util.splitter_fn(';'), util.splitter_fn(','))